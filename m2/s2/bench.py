@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+bench.py
+
+Benchmark registry and command-line runner for container operations.
+
+A benchmark case is (setup, operation, sizes): setup(n) builds the input
+outside the timed region and operation(container) performs exactly one
+operation on it. Cases are grouped into suites, one suite per structure,
+and case names come from CASE_NAMES (the container_bench operation names),
+so the same case (e.g. "tail_insert") is compared across every suite.
+Each structure is registered by exactly one module.
+
+Modules contribute cases without editing this file (or solution.py) by
+defining a hook, which is called with the registry's `register` function:
+
+    def register_benchmarks(register):
+        register("TieredVector", "middle_insert", setup=lambda n: TieredVector(range(n)),
+                 operation=lambda tv: tv.insert(len(tv) // 2, -1))
+
+Hooks are looked up in DEFAULT_MODULES plus any --module given on the
+command line. Cases are timed with solution.time_operation (warmup,
+autorange batching capped at n // 10 calls, median of `repeats` samples).
+
+Usage:
+    python -m bench --list                         # show registered suites/cases
+    python -m bench list DynamicArray              # whole suites by name
+    python -m bench "*.tail_insert" --sizes 1000 100000   # one operation across every suite
+    python -m bench "*.pop_head" --module my_structures
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from solution import time_operation
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_MODULES = ("container_bench", "tiered_vector")
+# shared case names; a structure registers the ones it supports
+CASE_NAMES = ("head_insert", "tail_insert", "middle_insert", "pop_head", "pop_tail", "search", "iterate")
+
+
+class BenchmarkCase:
+    """One registered (setup, operation, sizes) benchmark."""
+
+    __slots__ = ("suite", "name", "setup", "operation", "sizes")
+
+    def __init__(self, suite: str, name: str, setup: Callable[[int], Any],
+                 operation: Callable[[Any], Any], sizes: Iterable[int] = DEFAULT_SIZES):
+        self.suite = suite
+        self.name = name
+        self.setup = setup
+        self.operation = operation
+        self.sizes = tuple(sizes)
+
+    @property
+    def key(self) -> str:
+        return f"{self.suite}.{self.name}"
+
+    def __repr__(self):
+        return f"BenchmarkCase({self.key!r}, sizes={list(self.sizes)})"
+
+
+# suite -> case name -> case, in registration order
+REGISTRY: Dict[str, Dict[str, BenchmarkCase]] = {}
+
+
+def register(suite: str, name: str, setup: Callable[[int], Any], operation: Callable[[Any], Any],
+             sizes: Iterable[int] = DEFAULT_SIZES) -> BenchmarkCase:
+    """Add (or replace) case `name` in `suite` and return it."""
+    case = BenchmarkCase(suite, name, setup, operation, sizes)
+    REGISTRY.setdefault(suite, {})[name] = case
+    return case
+
+
+def load_modules(modules: Iterable[str] = DEFAULT_MODULES) -> None:
+    """Import each module and call its register_benchmarks(register) hook, if it has one."""
+    for name in modules:
+        module = importlib.import_module(name)
+        hook = getattr(module, "register_benchmarks", None)
+        if hook is not None:
+            hook(register)
+
+
+def select(patterns: Iterable[str]) -> List[BenchmarkCase]:
+    """
+    Cases whose suite name or "suite.case" key matches any glob pattern,
+    in registration order. Raises KeyError if a pattern matches nothing.
+    """
+    patterns = list(patterns)
+    cases = [case for suite in REGISTRY.values() for case in suite.values()]
+    chosen = []
+    for pattern in patterns:
+        matched = [c for c in cases if fnmatch.fnmatchcase(c.suite, pattern) or fnmatch.fnmatchcase(c.key, pattern)]
+        if not matched:
+            raise KeyError(f"no benchmark matches {pattern!r}; see --list")
+        chosen.extend(c for c in matched if c not in chosen)
+    return chosen
+
+
+def run(cases: Iterable[BenchmarkCase], repeats: int = 5, sizes: Optional[Iterable[int]] = None) -> List[dict]:
+    """Time every case at each size; returns [{'suite', 'case', 'size', 'seconds'}]."""
+    records = []
+    for case in cases:
+        for n in (sizes or case.sizes):
+            seconds = time_operation(case.operation, repeats=repeats, setup=lambda: case.setup(n),
+                                     max_number=max(1, n // 10))
+            records.append({"suite": case.suite, "case": case.name, "size": n, "seconds": seconds})
+            print(f"{case.key:>36} n={n:<9} {seconds:.3e}s", file=sys.stderr)
+    return records
+
+
+def print_table(records: List[dict]) -> None:
+    """
+    One row per suite.case, one column per size. Each cell shows the median
+    time and its ratio to the fastest suite for the same case name and size.
+    """
+    sizes = sorted({r["size"] for r in records})
+    fastest: Dict[tuple, float] = {}
+    for r in records:
+        cell = (r["case"], r["size"])
+        fastest[cell] = min(fastest.get(cell, r["seconds"]), r["seconds"])
+    rows: Dict[str, Dict[int, dict]] = {}
+    for r in sorted(records, key=lambda r: (r["case"], r["suite"])):
+        rows.setdefault(f"{r['suite']}.{r['case']}", {})[r["size"]] = r
+
+    width = max(len(key) for key in rows)
+    print(f"{'benchmark':<{width}}" + "".join(f" | {'n=' + str(n):>19}" for n in sizes))
+    print("-" * width + "".join("-+-" + "-" * 19 for _ in sizes))
+    for key, by_size in rows.items():
+        cells = []
+        for n in sizes:
+            r = by_size.get(n)
+            if r is None:
+                cells.append(f" | {'-':>19}")
+                continue
+            ratio = r["seconds"] / fastest[(r["case"], n)]
+            cells.append(f" | {r['seconds']:.3e}s {ratio:>7.2f}x")
+        print(f"{key:<{width}}" + "".join(cells))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Run registered container benchmarks.")
+    parser.add_argument("patterns", nargs="*", default=["*"], help="suite names or suite.case globs")
+    parser.add_argument("--list", action="store_true", help="list registered cases and exit")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None, help="override every case's sizes")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--module", action="append", default=[],
+                        help="extra module whose register_benchmarks(register) hook adds cases")
+    args = parser.parse_args(argv)
+
+    load_modules(list(DEFAULT_MODULES) + args.module)
+    if args.list:
+        for suite, cases in REGISTRY.items():
+            print(f"{suite}: {', '.join(cases)}")
+        return 0
+    try:
+        cases = select(args.patterns)
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 2
+    print_table(run(cases, repeats=args.repeats, sizes=args.sizes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+container_bench.py
+
+Benchmark suite that runs every container from the Module 2 sessions through
+the same operation matrix:
+
+    structures: list, deque, LinkedList (s4), DynamicArray and
+                CircularDynamicArray (s2), Stack / Queue (s3)
+    operations: head_insert, tail_insert, middle_insert, pop_head, pop_tail,
+                search (miss), iterate (full pass), bulk_build
+
+For each (structure, operation, size) cell the operation is timed with
+solution.measure_operation (warmup, autorange batching capped at n // 100
+calls, median/IQR/CI over `repeats` samples). Every batch starts from a fresh
+container built by the untimed setup, so it stays near size n and pops never
+run dry. Operations a structure
+does not offer are skipped. Results are emitted
+as JSON so hot-path choices can be made from data.
+
+Usage:
+    python container_bench.py                     # sizes 10^3 .. 10^7
+    python container_bench.py --sizes 1000 10000 --output bench.json
+    python -m bench list deque "*.pop_head"       # same cases via the bench.py registry
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import sys
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+M2 = os.path.dirname(HERE)
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+OPERATIONS = [
+    "head_insert",
+    "tail_insert",
+    "middle_insert",
+    "pop_head",
+    "pop_tail",
+    "search",
+    "iterate",
+    "bulk_build",
+]
+# these remove an element per call, so they need a non-empty container
+POP_OPERATIONS = ("pop_head", "pop_tail")
+
+
+def _load(name: str, path: str):
+    """
+    Import a session module by file path under a unique name.
+    (m2/s3/queue.py would shadow the stdlib `queue` if its folder went on sys.path.)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _consume(iterable) -> None:
+    for _ in iterable:
+        pass
+
+
+def load_structures() -> Dict[str, Dict[str, Any]]:
+    """
+    Return {name: {"build": fn(n) -> container, op: fn(container) or None}}.
+    Every op callable performs exactly one operation on the container.
+    """
+    linked_lists = _load("m2s4_linked_lists", os.path.join(M2, "s4", "linked_lists.py"))
+    solution = _load("m2s2_solution", os.path.join(HERE, "solution.py"))
+    stack_mod = _load("m2s3_stack", os.path.join(M2, "s3", "stack.py"))
+    queue_mod = _load("m2s3_queue", os.path.join(M2, "s3", "queue.py"))
+    LinkedList = linked_lists.LinkedList
+    DynamicArray = solution.DynamicArray
+    CircularDynamicArray = solution.CircularDynamicArray
+    Stack, Queue = stack_mod.Stack, queue_mod.Queue
+
+    def build_dynamic_array(n, cls=DynamicArray):
+        da = cls()
+        for i in range(n):
+            da.append(i)
+        return da
+
+    def build_stack(n):
+        s = Stack()
+        for i in range(n):
+            s.push(i)
+        return s
+
+    def build_queue(n):
+        q = Queue()
+        for i in range(n):
+            q.enqueue(i)
+        return q
+
+    return {
+        "list": {
+            "build": lambda n: list(range(n)),
+            "head_insert": lambda c: c.insert(0, -1),
+            "tail_insert": lambda c: c.append(-1),
+            "middle_insert": lambda c: c.insert(len(c) // 2, -1),
+            "pop_head": lambda c: c.pop(0),
+            "pop_tail": lambda c: c.pop(),
+            "search": lambda c: -2 in c,
+            "iterate": _consume,
+        },
+        "deque": {
+            "build": lambda n: deque(range(n)),
+            "head_insert": lambda c: c.appendleft(-1),
+            "tail_insert": lambda c: c.append(-1),
+            "middle_insert": lambda c: c.insert(len(c) // 2, -1),
+            "pop_head": lambda c: c.popleft(),
+            "pop_tail": lambda c: c.pop(),
+            "search": lambda c: -2 in c,
+            "iterate": _consume,
+        },
+        "LinkedList": {
+            "build": lambda n: LinkedList.from_iterable(range(n)),
+            "head_insert": lambda c: c.insert_at_beginning(-1),
+            "tail_insert": lambda c: c.insert_at_end(-1),
+            "middle_insert": lambda c: c.insert_at_position(len(c) // 2, -1),
+            # no pop(): delete_by_value on the head is O(1), on the tail O(n)
+            "pop_head": lambda c: c.delete_by_value(c.head.data),
+            "pop_tail": lambda c: c.delete_by_value(c.tail.data),
+            "search": lambda c: c.search(-2),
+            "iterate": _consume,
+        },
+        "DynamicArray": {
+            "build": build_dynamic_array,
+            "head_insert": lambda c: c.insert(0, -1),
+            "tail_insert": lambda c: c.append(-1),
+            "middle_insert": lambda c: c.insert(len(c) // 2, -1),
+            "pop_head": lambda c: c.pop(0),
+            "pop_tail": lambda c: c.pop(),
+            "search": lambda c: -2 in c,
+            "iterate": _consume,
+        },
+        "CircularDynamicArray": {
+            "build": lambda n: build_dynamic_array(n, CircularDynamicArray),
+            "head_insert": lambda c: c.insert(0, -1),
+            "tail_insert": lambda c: c.append(-1),
+            "middle_insert": lambda c: c.insert(len(c) // 2, -1),
+            "pop_head": lambda c: c.pop(0),
+            "pop_tail": lambda c: c.pop(),
+            "search": lambda c: -2 in c,
+            "iterate": _consume,
+        },
+        "Stack": {
+            "build": build_stack,
+            "tail_insert": lambda c: c.push(-1),
+            "pop_tail": lambda c: c.pop(),
+        },
+        "Queue": {
+            "build": build_queue,
+            "tail_insert": lambda c: c.enqueue(-1),
+            "pop_head": lambda c: c.dequeue(),
+        },
+    }
+
+
+def run_suite(
+    sizes: List[int],
+    repeats: int = 5,
+    structures: Optional[List[str]] = None,
+    operations: Optional[List[str]] = None,
+) -> dict:
+    """Run the operation matrix and return a JSON-serializable report."""
+    table = load_structures()
+    measure_operation = _load("m2s2_solution", os.path.join(HERE, "solution.py")).measure_operation
+    names = structures or list(table)
+    ops = operations or OPERATIONS
+    records = []
+
+    for n in sizes:
+        for name in names:
+            spec = table[name]
+            build = spec["build"]
+            for op in ops:
+                if op == "bulk_build":
+                    stats = measure_operation(lambda: build(n), repeats=max(1, min(repeats, 3)), warmup=0, number=1)
+                else:
+                    func = spec.get(op)
+                    if func is None or (op in POP_OPERATIONS and n < 1):
+                        continue
+                    # every batch (autorange, warmup, samples) gets its own untimed build(n),
+                    # so a batch of at most max(1, n // 100) calls never empties it
+                    stats = measure_operation(func, setup=lambda: build(n), repeats=repeats,
+                                              max_number=max(1, n // 100))
+                records.append({
+                    "structure": name,
+                    "operation": op,
+                    "size": n,
+                    "seconds": stats["median"],
+                    "iqr": stats["iqr"],
+                    "ci_low": stats["ci_low"],
+                    "ci_high": stats["ci_high"],
+                    "number": stats["number"],
+                })
+                print(f"n={n:>9} | {name:>20} | {op:>13} | {stats['median']:.3e}s", file=sys.stderr)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "repeats": repeats,
+        },
+        "sizes": list(sizes),
+        "results": records,
+        "fastest": fastest_by_cell(records),
+    }
+
+
+def fastest_by_cell(records: List[dict]) -> Dict[str, Dict[str, str]]:
+    """{operation: {size: structure}} - the winner for every measured cell."""
+    best: Dict[str, Dict[str, tuple]] = {}
+    for r in records:
+        cell = best.setdefault(r["operation"], {})
+        key = str(r["size"])
+        if key not in cell or r["seconds"] < cell[key][1]:
+            cell[key] = (r["structure"], r["seconds"])
+    return {op: {size: winner for size, (winner, _) in cells.items()} for op, cells in best.items()}
+
+
+def register_benchmarks(register) -> None:
+    """bench.py hook: each (structure, operation) pair as case `operation` in suite `structure`."""
+    for name, spec in load_structures().items():
+        for op in OPERATIONS:
+            func = spec.get(op)
+            if func is not None:
+                register(name, op, setup=spec["build"], operation=func)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Module 2 containers.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--structures", nargs="+", default=None)
+    parser.add_argument("--operations", nargs="+", default=None, choices=OPERATIONS)
+    parser.add_argument("--output", default=None, help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.repeats, args.structures, args.operations)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+        print(f"Saved results to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+mmap_array.py
+
+File-backed DynamicArray for data larger than RAM.
+
+MmapDynamicArray keeps its typed elements in a memory-mapped file instead of
+an in-memory array.array, so the OS pages data in and out on demand:
+ - growth (per the same GrowthPolicy as DynamicArray) extends the file
+ - reopening an existing file maps it again: no load or parse step
+ - extend() streams its input in EXTEND_CHUNK-element blocks instead of
+   building the whole batch in memory first
+ - everything else (insert, pop, insert_many, delete_range, stats, buffer
+   export) is inherited from DynamicArray
+
+Only a missing path is created; opening an existing file that lacks the
+header raises ValueError instead of overwriting it.
+
+File layout: a 64-byte header (magic, typecode, element count) followed by
+`capacity` fixed-size elements. The element count in the header is written
+by flush() and close(); use the array as a context manager so it is always
+persisted.
+
+Usage:
+    with MmapDynamicArray("metrics.bin", typecode='d') as arr:
+        arr.extend(values)
+    with MmapDynamicArray("metrics.bin") as arr:   # reopen, zero load time
+        print(len(arr), arr[0])
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from itertools import islice
+from typing import Optional
+
+from solution import DynamicArray, GrowthPolicy
+
+MAGIC = b"DYNARR1\0"
+HEADER = struct.Struct("<8sc7xQ")  # magic, typecode, padding, size
+HEADER_SIZE = 64  # keeps the element region aligned for every typecode
+EXTEND_CHUNK = 64 * 1024  # elements buffered in RAM per extend() step
+
+
+class MmapDynamicArray(DynamicArray):
+    """Typed DynamicArray whose storage is a memory-mapped file at `path`."""
+
+    def __init__(self, path: str, typecode: Optional[str] = None, initial_capacity: int = 1024,
+                 growth: Optional[GrowthPolicy | str] = None):
+        self.path = path
+        # only a missing path is created; any existing file must carry our header,
+        # so pointing this at the wrong file can never overwrite it
+        existing = os.path.exists(path)
+        stored_typecode, stored_size = None, 0
+        if existing:
+            with open(path, "rb") as f:
+                header = f.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a MmapDynamicArray file")
+            _, raw_typecode, stored_size = HEADER.unpack(header[:HEADER.size])
+            stored_typecode = raw_typecode.decode("ascii")
+            if typecode is not None and typecode != stored_typecode:
+                raise ValueError(f"{path} holds typecode {stored_typecode!r}, not {typecode!r}")
+            typecode = stored_typecode
+        if typecode is None:
+            typecode = 'd'
+
+        # tiny in-memory placeholder; replaced by the mapping below
+        super().__init__(1, typecode, growth)
+        self._itemsize = array(typecode).itemsize
+
+        if existing:
+            self._file = open(path, "r+b")
+            capacity = (os.path.getsize(path) - HEADER_SIZE) // self._itemsize
+        else:
+            self._file = open(path, "x+b")
+            capacity = max(1, initial_capacity)
+            self._file.truncate(HEADER_SIZE + capacity * self._itemsize)
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._data = self._map_view()
+        self._capacity = self._peak_capacity = capacity
+        self._size = stored_size
+        self.flush()
+
+    def _map_view(self) -> memoryview:
+        return memoryview(self._mmap)[HEADER_SIZE:].cast(self._typecode)
+
+    def _resize(self, new_capacity: int):
+        if new_capacity < self._size:
+            raise ValueError("new_capacity must be >= size")
+        if self._exports:
+            raise BufferError("cannot resize DynamicArray while a buffer export is active")
+        # the mapping can only be resized once our own view of it is released
+        self._data.release()
+        new_length = HEADER_SIZE + new_capacity * self._itemsize
+        try:
+            self._mmap.resize(new_length)
+        except (SystemError, OSError):
+            # no mremap() (macOS / BSD): resize the file and map it again instead
+            self._mmap.close()
+            self._file.truncate(new_length)
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._data = self._map_view()
+        self._resizes += 1
+        if new_capacity > self._capacity:
+            self._grows += 1
+        # the file is extended or truncated in place: no elements are copied
+        self._peak_capacity = max(self._peak_capacity, new_capacity)
+        self._capacity = new_capacity
+
+    def extend(self, items) -> None:
+        """
+        Append every item, reading `items` EXTEND_CHUNK elements at a time so
+        an iterable larger than RAM never has to be materialized. Growth
+        still follows the policy, so the number of resizes stays amortized.
+        """
+        if items is self:
+            items = islice(self, self._size)  # only the items present before the call
+        items = iter(items)
+        while True:
+            block = array(self._typecode, islice(items, EXTEND_CHUNK))
+            k = len(block)
+            if k == 0:
+                return
+            self._reserve(self._size + k)
+            self._data[self._size:self._size + k] = block
+            self._size += k
+
+    def memory_bytes(self) -> int:
+        """Bytes mapped from the file (resident memory is up to the OS)."""
+        return len(self._mmap)
+
+    # ---------- Persistence ----------
+    def flush(self) -> None:
+        """Write the header (element count) and flush dirty pages to the file."""
+        self._mmap[:HEADER.size] = HEADER.pack(MAGIC, self._typecode.encode("ascii"), self._size)
+        self._mmap.flush()
+
+    def close(self) -> None:
+        if self._mmap.closed:
+            return
+        self.flush()
+        self._data.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> MmapDynamicArray:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"MmapDynamicArray(path={self.path!r}, size={self._size}, "
+                f"capacity={self._capacity}, typecode={self._typecode!r})")
+
+
+# -----
+# Demo
+# -----
+
+
+def demo_mmap_array(n: int = 1_000_000):
+    print(f"=== MmapDynamicArray demo, n={n} ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "metrics.bin")
+
+        start = time.perf_counter()
+        with MmapDynamicArray(path, typecode='d') as arr:
+            arr.extend(float(i) for i in range(n))
+            arr.insert(0, -1.0)
+            print("Built:", arr, "stats:", arr.stats())
+        print(f"Build + close: {time.perf_counter() - start:.3f}s, file size {os.path.getsize(path)} bytes")
+
+        start = time.perf_counter()
+        with MmapDynamicArray(path) as arr:
+            reopen = time.perf_counter() - start
+            print(f"Reopen: {reopen * 1000:.2f} ms, len={len(arr)}, arr[0]={arr[0]}, arr[-1]={arr[len(arr) - 1]}")
+            assert len(arr) == n + 1 and arr[0] == -1.0 and arr[n] == float(n - 1)
+            arr.pop(0)
+            arr.append(42.0)
+        with MmapDynamicArray(path) as arr:
+            assert arr[0] == 0.0 and arr[len(arr) - 1] == 42.0, "changes should persist"
+
+
+if __name__ == "__main__":
+    demo_mmap_array()
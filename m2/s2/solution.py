@@ -7,136 +7,739 @@ Single-file program for:
 - Solutions to practice problems:
     - reverse_in_place(lst)
     - flatten_2d(lst2d)
+    - iter_flatten(data): streaming flatten of arbitrary depth (explicit stack, no recursion)
     - count_duplicates_list_only(lst)
     - max_in_sublists(list_of_lists)
-    - DynamicArray (doubling/shrinking)
+    - DynamicArray (doubling/shrinking, optional typed array.array storage)
+    - CircularDynamicArray (ring buffer: O(1) insert(0, x) / pop(0))
+    - benchmark_bulk_copy: per-element loop vs slice copy for resize / insert shifts
 - Demo and simple tests.
 
 Usage:
     python dsa_session2_exercises.py
+    python dsa_session2_exercises.py --save run.json      # also persist results (.json/.csv)
+    python dsa_session2_exercises.py --compare old.json new.json
+    python dsa_session2_exercises.py --workers 4 --pin     # parallel size sweep, one core per worker
+    python dsa_session2_exercises.py --memory              # add per-batch peak memory / net blocks columns
+    python dsa_session2_exercises.py --headless --formats png csv   # no window: write files (CI / servers)
+    python dsa_session2_exercises.py --bulk-copy           # loop vs slice copy timings for DynamicArray
 
 Requirements:
     - Python 3.7+
-    - matplotlib (optional, for plotting). If not available the program still runs timings and prints results.
+    - matplotlib (optional, for plotting; imported only when a plot is drawn). If not available the
+      program still runs timings and prints results.
 """
 
 from __future__ import annotations
+import argparse
+from abc import ABC, abstractmethod
+import csv
+import gc
+import importlib.util
+import json
+import os
+import platform
 import time
+import tracemalloc
+from array import array
 import sys
 import math
 import statistics
-from typing import List, Any, Iterable, Optional, Tuple
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import List, Any, Iterable, Iterator, Optional, Tuple
 
-# Try import matplotlib but keep optional
-try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except Exception:
-    MATPLOTLIB_AVAILABLE = False
+# matplotlib is optional and imported lazily on first plot: importing pyplot
+# costs more than most profiling runs, and headless runs pick the Agg backend
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+PLOT_FORMATS = ('png', 'svg', 'csv')
+
+
+def _import_pyplot(headless: bool = False):
+    """Import matplotlib.pyplot on first use (Agg backend when headless); None if unavailable."""
+    try:
+        import matplotlib
+        if headless:
+            matplotlib.use('Agg')  # renders to files only, needs no display
+        import matplotlib.pyplot as plt
+    except Exception:
+        return None
+    return plt
 
 
 # ---------------------------
 # Timing utilities & profiler
 # ---------------------------
 
-def time_operation(func, repeats: int = 5) -> float:
-    """Time a callable `func` executed `repeats` times and return average seconds."""
+# timeit-style autorange: batch sizes tried in order until a batch is long enough
+_AUTORANGE_STEPS = (1, 2, 5)
+
+
+def _median_ci(ordered: List[float], confidence: float) -> Tuple[float, float, float]:
+    """
+    Distribution-free confidence interval for the median of sorted samples.
+    Uses order statistics: [x_(j), x_(n-j+1)] covers the median with probability
+    1 - 2 * P(Binomial(n, 1/2) <= j - 1). Returns (low, high, achieved_level);
+    with very few samples the achieved level may be below `confidence`.
+    """
+    n = len(ordered)
+
+    def coverage(j: int) -> float:
+        return 1 - 2 * sum(math.comb(n, i) for i in range(j)) / 2 ** n
+
+    j = 1
+    while j + 1 <= (n + 1) // 2 and coverage(j + 1) >= confidence:
+        j += 1
+    return ordered[j - 1], ordered[n - j], coverage(j)
+
+
+def summarize_samples(samples: List[float], confidence: float = 0.95) -> dict:
+    """Median, IQR, mean/stdev and a median confidence interval for per-call timings."""
+    ordered = sorted(samples)
+    if len(ordered) >= 2:
+        q1, _, q3 = statistics.quantiles(ordered, n=4, method='inclusive')
+    else:
+        q1 = q3 = ordered[0]
+    ci_low, ci_high, ci_level = _median_ci(ordered, confidence)
+    return {
+        'median': statistics.median(ordered),
+        'mean': statistics.mean(ordered),
+        'stdev': statistics.stdev(ordered) if len(ordered) >= 2 else 0.0,
+        'min': ordered[0],
+        'max': ordered[-1],
+        'q1': q1,
+        'q3': q3,
+        'iqr': q3 - q1,
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'ci_level': ci_level,
+        'samples': len(ordered),
+    }
+
+
+def measure_operation(func, setup=None, teardown=None, repeats: int = 7, warmup: int = 1,
+                      number: Optional[int] = None, min_batch_time: float = 0.005,
+                      max_number: Optional[int] = None, confidence: float = 0.95) -> dict:
+    """
+    Time `func` with setup/teardown kept out of the timed region.
+
+    Every sample calls `state = setup()` (untimed), then times `number` back-to-back
+    calls of `func(state)` (or `func()` without setup), then calls
+    `teardown(state)` (untimed). The per-call time of each sample is batch / number.
+
+    - warmup: samples run first and discarded (caches, allocator, branch predictors)
+    - number: calls per sample; None => timeit-style autorange (1, 2, 5, 10, 20, ...)
+      until one batch takes >= min_batch_time, capped at max_number. Cap it when
+      repeated calls change the state (e.g. pop on a list of n items).
+    - returns summarize_samples() of the `repeats` per-call samples plus 'number'.
+    """
     if repeats <= 0:
         raise ValueError("repeats must be >= 1")
-    times = []
-    for _ in range(repeats):
-        start = time.perf_counter()
-        func()
-        end = time.perf_counter()
-        times.append(end - start)
-    return statistics.mean(times)
 
+    def run_batch(count: int) -> float:
+        state = setup() if setup is not None else None
+        if setup is not None:
+            start = time.perf_counter()
+            for _ in range(count):
+                func(state)
+            elapsed = time.perf_counter() - start
+        else:
+            start = time.perf_counter()
+            for _ in range(count):
+                func()
+            elapsed = time.perf_counter() - start
+        if teardown is not None:
+            teardown(state)
+        return elapsed
+
+    if number is None:
+        number = 1
+        multiplier = 1
+        done = False
+        while not done:
+            for step in _AUTORANGE_STEPS:
+                candidate = step * multiplier
+                if max_number is not None and candidate >= max_number:
+                    number, done = max_number, True
+                    break
+                number = candidate
+                if run_batch(number) >= min_batch_time:
+                    done = True
+                    break
+            multiplier *= 10
+
+    for _ in range(warmup):
+        run_batch(number)
+    samples = [run_batch(number) / number for _ in range(repeats)]
+    stats = summarize_samples(samples, confidence)
+    stats['number'] = number
+    stats['values'] = samples  # raw per-call samples, used by compare_results
+    return stats
+
+
+def time_operation(func, repeats: int = 5, setup=None, teardown=None, warmup: int = 1,
+                   max_number: Optional[int] = None) -> float:
+    """
+    Time a callable and return the median seconds per call.
+    See measure_operation for setup/teardown, warmup and autorange batching.
+    """
+    return measure_operation(func, setup=setup, teardown=teardown, repeats=repeats, warmup=warmup,
+                             max_number=max_number)['median']
+
+
+def _noop(*args) -> None:
+    pass
+
+
+def _run_batch(func, arg, number: int) -> None:
+    # repeat() hands out the same object each time, so the loop itself allocates nothing
+    if arg is None:
+        for _ in repeat(None, number):
+            func()
+    else:
+        for arg in repeat(arg, number):
+            func(arg)
+
+
+def _batch_net_blocks(func, arg, number: int) -> int:
+    """Memory blocks a batch leaves alive (new - freed); tracing must be on."""
+    before = tracemalloc.take_snapshot()
+    _run_batch(func, arg, number)
+    after = tracemalloc.take_snapshot()
+    # nothing else runs between the snapshots; ignore the snapshots' own bookkeeping
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'traceback')
+    return sum(stat.count_diff for stat in diff)
+
+
+def _batch_peak(func, arg, number: int) -> int:
+    """Peak traced bytes above the pre-batch level; tracing must be on."""
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    _run_batch(func, arg, number)
+    return tracemalloc.get_traced_memory()[1] - baseline
 
-def profile_list_operations(sizes: Iterable[int], repeats: int = 3) -> dict:
+
+def measure_memory(func, setup=None, number: int = 1) -> dict:
     """
-    Profile list operations for given sizes.
-    Returns dict with keys: 'append', 'insert0', 'pop', 'pop0' => lists of times per size.
-    Each operation is measured by preparing a list of the target size and then performing
-    the operation `repeats` times (re-initializing as needed).
-    """
-    results = {
-        'sizes': [],
-        'append': [],
-        'insert0': [],
-        'pop': [],
-        'pop0': []
+    Run `func` `number` times under tracemalloc and report:
+      peak_bytes          highest traced memory above the pre-run baseline (per batch)
+      net_blocks          memory blocks still alive afterwards, new - freed (per batch);
+                          a temporary that is allocated and freed again counts 0
+      net_blocks_per_call net_blocks / number (blocks are additive, peaks are not)
+      getsizeof_growth    change in sys.getsizeof of the setup() container (per batch;
+                          the over-allocation jumps shown in dynamic_resizing.py)
+    Blocks and peak come from two separate batches, each on its own setup()
+    input: the blocks batch runs between two snapshots with nothing else
+    allocating in between, and the peak batch has the few bytes its own
+    get_traced_memory() call allocates subtracted via a no-op calibration
+    batch. A no-op therefore reports 0 for both.
+    setup() runs before tracing starts, so building the input is not counted.
+    """
+    arg = setup() if setup is not None else None
+    peak_arg = setup() if setup is not None else None
+    size_before = sys.getsizeof(arg) if arg is not None else 0
+    was_tracing = tracemalloc.is_tracing()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # a collection mid-batch would free unrelated blocks, like timeit
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        net_blocks = _batch_net_blocks(func, arg, number)
+        base_peak = _batch_peak(_noop, peak_arg, number)
+        peak = _batch_peak(func, peak_arg, number)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        'peak_bytes': max(0, peak - base_peak),
+        'net_blocks': net_blocks,
+        'net_blocks_per_call': net_blocks / number,
+        'getsizeof_growth': (sys.getsizeof(arg) - size_before) if arg is not None else 0,
+        'number': number,
     }
 
-    for n in sizes:
-        results['sizes'].append(n)
 
-        # Prepare baseline data: list of n elements
-        base = list(range(n))
+def _op_append(lst):
+    lst.append(-1)
 
-        # append: measure time to append one element to copy of base
-        def op_append():
-            lst = base.copy()
-            lst.append(-1)
 
-        t_append = time_operation(op_append, repeats=repeats)
+def _op_insert0(lst):
+    lst.insert(0, -1)
 
-        # insert(0, x): measure time to insert at start
-        def op_insert0():
-            lst = base.copy()
-            lst.insert(0, -1)
 
-        t_insert0 = time_operation(op_insert0, repeats=repeats)
+def _op_pop_end(lst):
+    if lst:
+        lst.pop()
 
-        # pop(): pop last element
-        def op_pop_end():
-            lst = base.copy()
-            if lst:
-                lst.pop()
 
-        t_pop = time_operation(op_pop_end, repeats=repeats)
+def _op_pop0(lst):
+    if lst:
+        lst.pop(0)
 
-        # pop(0): pop from start
-        def op_pop0():
-            lst = base.copy()
-            if lst:
-                lst.pop(0)
 
-        t_pop0 = time_operation(op_pop0, repeats=repeats)
+# module-level so worker processes can pickle them by name
+LIST_OPERATIONS = {'append': _op_append, 'insert0': _op_insert0, 'pop': _op_pop_end, 'pop0': _op_pop0}
 
-        results['append'].append(t_append)
-        results['insert0'].append(t_insert0)
-        results['pop'].append(t_pop)
-        results['pop0'].append(t_pop0)
 
-        print(f"n={n:7d} | append={t_append:.6f}s | insert0={t_insert0:.6f}s | pop_end={t_pop:.6f}s | pop0={t_pop0:.6f}s")
+def _profile_cell(n: int, name: str, repeats: int, memory: bool = False) -> Tuple[dict, Optional[dict]]:
+    """
+    Time one (size, operation) cell; the list of n elements is copied in setup.
+    With memory=True, also run one traced batch of the same number of calls
+    (separately, since tracemalloc slows every allocation down).
+    """
+    base = list(range(n))
+    op = LIST_OPERATIONS[name]
+    stats = measure_operation(op, setup=base.copy, repeats=repeats, max_number=max(1, n // 10))
+    mem = measure_memory(op, setup=base.copy, number=stats['number']) if memory else None
+    return stats, mem
+
+
+def _pin_worker(cores) -> None:
+    """Pool initializer: pin this worker process to one core taken from the shared queue."""
+    core = cores.get()
+    if core is not None:
+        os.sched_setaffinity(0, {core})
+
+
+def _run_cells_parallel(cells: List[Tuple[int, str]], repeats: int, workers: int, pin: bool,
+                        memory: bool) -> List[Tuple[dict, Optional[dict]]]:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    initializer, initargs = None, ()
+    if pin and hasattr(os, 'sched_setaffinity'):
+        available = sorted(os.sched_getaffinity(0))
+        workers = min(workers, len(available))
+        cores = multiprocessing.get_context().Queue()
+        for core in available[:workers]:
+            cores.put(core)
+        initializer, initargs = _pin_worker, (cores,)
+    elif pin:
+        print("CPU pinning needs os.sched_setaffinity (Linux); running unpinned.")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        futures = [pool.submit(_profile_cell, n, name, repeats, memory) for n, name in cells]
+        return [f.result() for f in futures]
+
+
+def profile_list_operations(sizes: Iterable[int], repeats: int = 5, workers: int = 1, pin: bool = False,
+                            memory: bool = False) -> dict:
+    """
+    Profile list operations for given sizes.
+    Returns dict with keys: 'append', 'insert0', 'pop', 'pop0' => lists of median
+    seconds per operation per size, plus 'stats' => {op: [measure_operation dicts]}.
+    The list of n elements is copied in setup, outside the timed region, so only
+    the operation itself is measured; batches are capped at n // 10 calls so the
+    list stays close to size n.
+
+    workers > 1 runs the independent (size, operation) cells in a process pool;
+    pin=True additionally pins each worker to its own core (Linux only) so the
+    workers don't migrate and disturb each other. Results have the same shape
+    either way. Parallel cells still share caches and memory bandwidth, so keep
+    workers at or below the number of physical cores.
+
+    memory=True adds 'memory' => {op: [measure_memory dicts]}, measured over
+    the same number of calls as each timing batch.
+    """
+    sizes = list(sizes)
+    names = list(LIST_OPERATIONS)
+    cells = [(n, name) for n in sizes for name in names]
+    if workers > 1:
+        cell_results = _run_cells_parallel(cells, repeats, workers, pin, memory)
+    else:
+        cell_results = [_profile_cell(n, name, repeats, memory) for n, name in cells]
+
+    results = {'sizes': sizes, **{name: [] for name in names}, 'stats': {name: [] for name in names}}
+    if memory:
+        results['memory'] = {name: [] for name in names}
+    for (n, name), (stats, mem) in zip(cells, cell_results):
+        results[name].append(stats['median'])
+        results['stats'][name].append(stats)
+        if memory:
+            results['memory'][name].append(mem)
+    for i, n in enumerate(sizes):
+        line = [f"n={n:7d}"]
+        for name in names:
+            st = results['stats'][name][i]
+            cell = f"{name}={st['median']:.3e}s (IQR {st['iqr']:.1e})"
+            if memory:
+                mem = results['memory'][name][i]
+                cell += (f" net_blocks/call={mem['net_blocks_per_call']:.2f}"
+                         f" | per {mem['number']}-call batch: peak={mem['peak_bytes']}B "
+                         f"net_blocks={mem['net_blocks']} grow={mem['getsizeof_growth']}B")
+            line.append(cell)
+        print(" | ".join(line))
 
     return results
 
 
+def _draw_profile(plt, results: dict):
+    """Build the profile figure: timings, plus peak memory and getsizeof growth in memory mode."""
+    sizes = results['sizes']
+    labels = {'append': 'append()', 'insert0': 'insert(0, x)', 'pop': 'pop() (end)', 'pop0': 'pop(0)'}
+    memory = results.get('memory')
+    if memory:
+        # memory mode: timings on top, tracemalloc peak and getsizeof growth below
+        fig, (ax_time, ax_peak, ax_grow) = plt.subplots(3, 1, figsize=(9, 11), sharex=True)
+    else:
+        fig, ax_time = plt.subplots(figsize=(9, 5))
+    for op in result_operations(results):
+        ax_time.plot(sizes, results[op], label=labels.get(op, op), marker='o')
+    ax_time.set_ylabel('time (seconds)')
+    ax_time.set_title('List operation timings')
+    if memory:
+        for op, cells in memory.items():
+            ax_peak.plot(sizes, [c['peak_bytes'] for c in cells], label=labels.get(op, op), marker='o')
+            ax_grow.plot(sizes, [c['getsizeof_growth'] for c in cells], label=labels.get(op, op), marker='o')
+        ax_peak.set_ylabel('tracemalloc peak (bytes / batch)')
+        ax_peak.set_title('Peak memory per timed batch')
+        ax_grow.set_ylabel('sys.getsizeof growth (bytes / batch)')
+        ax_grow.set_title('Container size change per timed batch')
+    axes = (ax_time, ax_peak, ax_grow) if memory else (ax_time,)
+    for ax in axes:
+        ax.legend()
+        ax.grid(True)
+    axes[-1].set_xlabel('n (list size)')
+    fig.tight_layout()
+    return fig
+
+
 def plot_profile(results: dict, save_path: Optional[str] = None) -> None:
-    """Plot results using matplotlib if available. Otherwise skip."""
-    if not MATPLOTLIB_AVAILABLE:
+    """Plot results interactively using matplotlib if available. Otherwise skip."""
+    plt = _import_pyplot()
+    if plt is None:
         print("\nmatplotlib not available — skipping plot. Install matplotlib to see graphs.")
         return
 
-    sizes = results['sizes']
-    plt.figure(figsize=(9, 5))
-    plt.plot(sizes, results['append'], label='append()', marker='o')
-    plt.plot(sizes, results['insert0'], label='insert(0, x)', marker='o')
-    plt.plot(sizes, results['pop'], label='pop() (end)', marker='o')
-    plt.plot(sizes, results['pop0'], label='pop(0)', marker='o')
-    plt.xlabel('n (list size)')
-    plt.ylabel('time (seconds)')
-    plt.title('List operation timings')
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
+    fig = _draw_profile(plt, results)
     if save_path:
-        plt.savefig(save_path)
+        fig.savefig(save_path)
         print(f"Saved plot to {save_path}")
     plt.show()
 
 
+def export_profile(results: dict, prefix: str, formats: Iterable[str] = PLOT_FORMATS) -> List[str]:
+    """
+    Headless export for CI / servers: write `prefix.<fmt>` for each format and
+    return the paths. Images are rendered with the Agg backend and plt.show()
+    is never called; 'csv' goes through save_results and needs no matplotlib.
+    """
+    formats = list(formats)
+    unknown = set(formats) - set(PLOT_FORMATS)
+    if unknown:
+        raise ValueError(f"unsupported formats {sorted(unknown)}; choose from {PLOT_FORMATS}")
+    written = []
+    if 'csv' in formats:
+        save_results(results, f"{prefix}.csv")
+        written.append(f"{prefix}.csv")
+    images = [fmt for fmt in formats if fmt != 'csv']
+    if images:
+        plt = _import_pyplot(headless=True)
+        if plt is None:
+            print("matplotlib not available — skipping", ", ".join(images), "export.")
+            return written
+        fig = _draw_profile(plt, results)
+        for fmt in images:
+            fig.savefig(f"{prefix}.{fmt}", format=fmt)
+            written.append(f"{prefix}.{fmt}")
+            print(f"Saved plot to {prefix}.{fmt}")
+        plt.close(fig)
+    return written
+
+
+# ---------------------------
+# Result persistence & regression detection
+# ---------------------------
+
+CSV_FIELDS = ['operation', 'size', 'median', 'q1', 'q3', 'ci_low', 'ci_high', 'number', 'values',
+              'peak_bytes', 'net_blocks', 'net_blocks_per_call', 'getsizeof_growth']
+MEMORY_FIELDS = ('peak_bytes', 'net_blocks', 'net_blocks_per_call', 'getsizeof_growth')
+
+
+def run_metadata() -> dict:
+    """Python version, machine info and timestamp attached to every saved result."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def result_operations(results: dict) -> List[str]:
+    """Operation names in a profile result dict (everything except bookkeeping keys)."""
+    return [k for k in results if k not in ('sizes', 'stats', 'memory')]
+
+
+def save_results(results: dict, path: str, meta: Optional[dict] = None) -> None:
+    """
+    Save profile_list_operations results to `path`; format from the extension:
+      .json -> {'meta': ..., 'results': ...}
+      .csv  -> one row per (operation, size) with meta columns on every row
+    """
+    meta = meta or run_metadata()
+    if path.endswith('.csv'):
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS + sorted(meta))
+            writer.writeheader()
+            for op in result_operations(results):
+                op_stats = results.get('stats', {}).get(op)
+                for i, n in enumerate(results['sizes']):
+                    row = {'operation': op, 'size': n, 'median': results[op][i], **meta}
+                    if op_stats:
+                        st = op_stats[i]
+                        row.update({k: st[k] for k in ('q1', 'q3', 'ci_low', 'ci_high', 'number')})
+                        row['values'] = ' '.join(repr(v) for v in st.get('values', []))
+                    if 'memory' in results:
+                        row.update({k: results['memory'][op][i][k] for k in MEMORY_FIELDS})
+                    writer.writerow(row)
+    else:
+        with open(path, 'w') as f:
+            json.dump({'meta': meta, 'results': results}, f, indent=2)
+    print(f"Saved results to {path}")
+
+
+def load_results(path: str) -> Tuple[dict, dict]:
+    """Load a file written by save_results; returns (meta, results)."""
+    if not path.endswith('.csv'):
+        with open(path) as f:
+            data = json.load(f)
+        return data.get('meta', {}), data['results']
+
+    meta: dict = {}
+    results: dict = {'sizes': [], 'stats': {}}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            op, n = row['operation'], int(row['size'])
+            meta = {k: row[k] for k in row if k not in CSV_FIELDS}
+            if n not in results['sizes']:
+                results['sizes'].append(n)
+            results.setdefault(op, []).append(float(row['median']))
+            st = {'median': float(row['median'])}
+            for key in ('q1', 'q3', 'ci_low', 'ci_high'):
+                if row.get(key):
+                    st[key] = float(row[key])
+            if row.get('values'):
+                st['values'] = [float(v) for v in row['values'].split()]
+            results['stats'].setdefault(op, []).append(st)
+            if row.get('peak_bytes'):
+                mem = {k: int(row[k]) for k in MEMORY_FIELDS if k != 'net_blocks_per_call'}
+                mem['net_blocks_per_call'] = float(row['net_blocks_per_call'])
+                mem['number'] = int(row['number'])
+                results.setdefault('memory', {}).setdefault(op, []).append(mem)
+    return meta, results
+
+
+@lru_cache(maxsize=None)
+def _u_counts(m: int, n: int) -> Tuple[int, ...]:
+    """counts[u] = number of orderings of m vs n samples with Mann-Whitney U == u."""
+    if m == 0 or n == 0:
+        return (1,)
+    a = _u_counts(m - 1, n)  # largest element comes from the first sample: adds n to U
+    b = _u_counts(m, n - 1)
+    counts = [0] * (m * n + 1)
+    for u, c in enumerate(a):
+        counts[u + n] += c
+    for u, c in enumerate(b):
+        counts[u] += c
+    return tuple(counts)
+
+
+def mann_whitney_greater(new: List[float], old: List[float]) -> float:
+    """
+    One-sided Mann-Whitney U test p-value for "new tends to be larger than old".
+    Exact distribution for small samples, normal approximation otherwise.
+    """
+    m, n = len(new), len(old)
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in new for y in old)
+    if m * n <= 400:
+        counts = _u_counts(m, n)
+        total = sum(counts)
+        return sum(counts[math.ceil(u):]) / total
+    mu = m * n / 2
+    sigma = math.sqrt(m * n * (m + n + 1) / 12)
+    z = (u - mu - 0.5) / sigma
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def compare_results(old: dict, new: dict, alpha: float = 0.05, min_change: float = 0.05) -> List[dict]:
+    """
+    Compare two result dicts cell by cell (operation x size present in both).
+    A cell is flagged as a slowdown when the new median is at least `min_change`
+    slower AND the difference is significant: Mann-Whitney p <= alpha when raw
+    samples are available, otherwise non-overlapping median confidence intervals.
+    Sample counts too small to ever reach p <= alpha (e.g. 2 vs 2 at 0.05) are
+    reported once and use the confidence-interval check instead.
+    """
+    rows = []
+    warned = False
+    for op in result_operations(new):
+        if op not in old:
+            continue
+        old_stats = old.get('stats', {}).get(op, [])
+        new_stats = new.get('stats', {}).get(op, [])
+        for j, n in enumerate(new['sizes']):
+            if n not in old['sizes']:
+                continue
+            i = old['sizes'].index(n)
+            old_t, new_t = old[op][i], new[op][j]
+            ratio = new_t / old_t if old_t else math.inf
+            p_value = None
+            o = old_stats[i] if i < len(old_stats) else {}
+            c = new_stats[j] if j < len(new_stats) else {}
+            usable = bool(o.get('values') and c.get('values'))
+            if usable and 1 / math.comb(len(o['values']) + len(c['values']), len(c['values'])) > alpha:
+                if not warned:
+                    print(f"warning: {len(o['values'])} vs {len(c['values'])} samples can't reach "
+                          f"p <= {alpha}; record more repeats. Falling back to CI overlap.")
+                    warned = True
+                usable = False
+            if usable:
+                p_value = mann_whitney_greater(c['values'], o['values'])
+                significant = p_value <= alpha
+            elif 'ci_high' in o and 'ci_low' in c:
+                significant = c['ci_low'] > o['ci_high']
+            else:
+                significant = False
+            rows.append({
+                'operation': op, 'size': n, 'old': old_t, 'new': new_t, 'ratio': ratio,
+                'p_value': p_value, 'slowdown': significant and ratio >= 1 + min_change,
+            })
+    return rows
+
+
+def print_comparison(rows: List[dict]) -> None:
+    print(f"{'operation':>10} {'n':>8} {'old':>11} {'new':>11} {'ratio':>7} {'p':>7}  verdict")
+    for r in rows:
+        p = f"{r['p_value']:.3f}" if r['p_value'] is not None else '-'
+        verdict = 'SLOWDOWN' if r['slowdown'] else ''
+        print(f"{r['operation']:>10} {r['size']:>8} {r['old']:>11.3e} {r['new']:>11.3e} "
+              f"{r['ratio']:>6.2f}x {p:>7}  {verdict}")
+
+
+# ---------------------------
+# Complexity-class fitting
+# ---------------------------
+
+# ordered from cheapest to most expensive; each maps n -> f(n) for t ~ a + b * f(n)
+COMPLEXITY_MODELS = {
+    'O(1)': lambda n: 0.0,
+    'O(log n)': lambda n: math.log(n),
+    'O(n)': lambda n: float(n),
+    'O(n log n)': lambda n: n * math.log(n),
+    'O(n^2)': lambda n: float(n) * n,
+}
+COMPLEXITY_RANK = {name: i for i, name in enumerate(COMPLEXITY_MODELS)}
+
+
+def _fit_model(fs: List[float], ts: List[float]) -> Tuple[float, float]:
+    """
+    Fit t ~ a + b * f with a, b >= 0, weighting by 1/t^2 so every size counts
+    by its relative error (otherwise the largest n dominates the fit).
+    """
+    w = [1 / (t * t) for t in ts]
+    sw = sum(w)
+    sf = sum(wi * f for wi, f in zip(w, fs))
+    st = sum(wi * t for wi, t in zip(w, ts))
+    sff = sum(wi * f * f for wi, f in zip(w, fs))
+    sft = sum(wi * f * t for wi, f, t in zip(w, fs, ts))
+    det = sw * sff - sf * sf
+    if det <= 0:  # constant model (all f equal)
+        return st / sw, 0.0
+    b = (sw * sft - sf * st) / det
+    a = (st - b * sf) / sw
+    if b < 0:
+        return st / sw, 0.0
+    if a < 0:
+        return 0.0, sft / sff
+    return a, b
+
+
+def fit_complexity(sizes: List[int], times: List[float], growth_tol: float = 1.0,
+                   parsimony: float = 1.5) -> dict:
+    """
+    Fit timings to each model in COMPLEXITY_MODELS and pick the best one.
+    Returns {'best': name, 'models': {name: {'a', 'b', 'r2', 'rel_rmse'}}}.
+
+    Best = the cheapest model whose relative RMSE is within `parsimony` times
+    the lowest one (cache effects bend real curves upward, so e.g. O(n log n)
+    often edges out the true O(n) by a little). A non-constant winner whose fitted curve grows
+    by less than `growth_tol` (1.0 = doubling) across the measured size range is
+    reported as O(1) instead: with noisy timings some slope always fits slightly
+    better, but a curve that barely moves is constant for practical purposes.
+    """
+    if len(sizes) < 3:
+        raise ValueError("need timings for at least 3 sizes to fit a complexity class")
+    ts = [max(t, 1e-12) for t in times]
+    mean_t = statistics.fmean(ts)
+    ss_tot = sum((t - mean_t) ** 2 for t in ts)
+    models = {}
+    for name, f in COMPLEXITY_MODELS.items():
+        fs = [f(n) for n in sizes]
+        a, b = _fit_model(fs, ts)
+        pred = [a + b * fi for fi in fs]
+        ss_res = sum((t - p) ** 2 for t, p in zip(ts, pred))
+        models[name] = {
+            'a': a,
+            'b': b,
+            'r2': 1 - ss_res / ss_tot if ss_tot else 1.0,
+            'rel_rmse': math.sqrt(statistics.fmean(((t - p) / t) ** 2 for t, p in zip(ts, pred))),
+        }
+    lowest = min(m['rel_rmse'] for m in models.values())
+    best = next(name for name in models if models[name]['rel_rmse'] <= parsimony * lowest)
+    f = COMPLEXITY_MODELS[best]
+    m = models[best]
+    lo, hi = min(sizes), max(sizes)
+    start = m['a'] + m['b'] * f(lo)
+    if best != 'O(1)' and start > 0 and m['b'] * (f(hi) - f(lo)) / start < growth_tol:
+        best = 'O(1)'
+    return {'best': best, 'models': models}
+
+
+def analyze_complexity(results: dict, **kwargs) -> dict:
+    """Run fit_complexity on every operation in a profile result dict: {op: fit}."""
+    return {op: fit_complexity(results['sizes'], results[op], **kwargs) for op in result_operations(results)}
+
+
+def print_complexity(fits: dict) -> None:
+    """
+    One row per operation: the chosen model, and the lowest-error model for
+    reference. When they differ, the simpler model was picked on purpose
+    (parsimony / flat-growth rule in fit_complexity), not because it fits best.
+    """
+    print(f"{'operation':>10}  {'best fit':<10} {'R^2':>6} {'rel RMSE':>9}  (lowest-error model)")
+    for op, fit in fits.items():
+        best = fit['best']
+        m = fit['models'][best]
+        lowest = min(fit['models'], key=lambda name: fit['models'][name]['rel_rmse'])
+        if lowest == best:
+            note = "same as best fit"
+        else:
+            note = f"{lowest}, rel RMSE {fit['models'][lowest]['rel_rmse']:.1%}; simpler model preferred"
+        print(f"{op:>10}  {best:<10} {m['r2']:>6.3f} {m['rel_rmse']:>8.1%}  ({note})")
+
+
+def check_complexity(fits: dict, expected: dict) -> None:
+    """
+    Check each operation's fitted class is no worse than expected, e.g.
+    check_complexity(fits, {'append': 'O(1)'}) raises AssertionError if append
+    drifts to O(n).
+    """
+    for op, allowed in expected.items():
+        got = fits[op]['best']
+        # explicit raise, not assert: this is a gate and must survive python -O
+        if COMPLEXITY_RANK[got] > COMPLEXITY_RANK[allowed]:
+            raise AssertionError(f"{op}: expected {allowed} or better, measured {got}")
+
+
 # ---------------------------
 # Practice problem solutions
 # ---------------------------
@@ -160,12 +763,63 @@ def flatten_2d(lst2d: Iterable[Iterable[Any]]) -> List[Any]:
     Flatten a 2D list (or iterable-of-iterables) to a single list.
     Preserves order.
     """
-    result = []
-    for row in lst2d:
-        # Accept any iterable row
-        for x in row:
-            result.append(x)
-    return result
+    # chain.from_iterable does the row-by-row concatenation in C; rows may be any iterable
+    return list(chain.from_iterable(lst2d))
+
+
+# types iter_flatten never descends into; dicts (JSON objects) count as records
+FLATTEN_ATOMS = (str, bytes, bytearray, dict)
+_SCALAR_TYPES = frozenset({int, float, complex, bool, type(None)})
+
+
+def iter_flatten(data: Any, atoms: Tuple[type, ...] = FLATTEN_ATOMS, max_depth: Optional[int] = None) -> Iterator[Any]:
+    """
+    Lazily flatten arbitrarily nested iterables, preserving order.
+    - instances of `atoms` and non-iterables are yielded as leaves
+    - max_depth limits how many nesting levels are removed (None = all)
+    - an explicit stack of iterators replaces recursion, so depth is bounded
+      by memory rather than the recursion limit, and nothing is materialized:
+      memory is O(depth), not O(n)
+    Fast path: each plain list holding only scalars/atoms is checked when it
+    is reached (one C-level pass over its types) and emitted with a single
+    `yield from`, so nothing is scanned ahead of the first value.
+    (For exactly two levels of plain iterables, flatten_2d's
+    itertools.chain.from_iterable is faster still.)
+    Raises ValueError on a container that (directly or indirectly) contains itself.
+    """
+    leaf_types = _SCALAR_TYPES.union(atoms)
+    if isinstance(data, atoms):
+        yield data
+        return
+    try:
+        stack = [iter(data)]
+    except TypeError:
+        yield data
+        return
+    path = [id(data)]
+    on_path = {id(data)}
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, atoms) or (max_depth is not None and len(stack) > max_depth):
+                yield item
+                continue
+            if type(item) is list and set(map(type, item)) <= leaf_types:
+                yield from item
+                continue
+            try:
+                it = iter(item)
+            except TypeError:
+                yield item
+                continue
+            if id(item) in on_path:
+                raise ValueError("cannot flatten a container that contains itself")
+            stack.append(it)
+            path.append(id(item))
+            on_path.add(id(item))
+            break  # descend: continue with the child's iterator
+        else:
+            stack.pop()
+            on_path.discard(path.pop())
 
 
 def count_duplicates_list_only(lst: List[Any]) -> List[Tuple[Any, int]]:
@@ -210,74 +864,295 @@ def max_in_sublists(list_of_lists: Iterable[Iterable[float]]) -> Optional[float]
 # DynamicArray Implementation
 # ---------------------------
 
+# array.array typecodes accepted by DynamicArray(typecode=...)
+NUMERIC_TYPECODES = "bBhHiIlLqQfd"
+
+
+class GrowthPolicy(ABC):
+    """
+    Decides DynamicArray capacities.
+    grow() returns a capacity >= needed; shrink() returns a smaller capacity or
+    None to keep the current one. Subclasses must implement both; an incomplete
+    policy fails with TypeError when it is created, not on the first resize.
+    """
+
+    def __init__(self, min_capacity: int = 4):
+        self.min_capacity = min_capacity
+
+    @abstractmethod
+    def grow(self, capacity: int, needed: int) -> int:
+        ...
+
+    @abstractmethod
+    def shrink(self, size: int, capacity: int) -> Optional[int]:
+        ...
+
+
+class FactorGrowth(GrowthPolicy):
+    """
+    Multiply capacity by `factor` when full; divide by `factor` when at most
+    1/factor^2 full. FactorGrowth(2.0) is the classic double / quarter-full-halve.
+    """
+
+    def __init__(self, factor: float = 2.0, min_capacity: int = 4):
+        if factor <= 1:
+            raise ValueError("factor must be > 1")
+        super().__init__(min_capacity)
+        self.factor = factor
+
+    def grow(self, capacity: int, needed: int) -> int:
+        new_cap = max(1, capacity)
+        while new_cap < needed:
+            new_cap = max(new_cap + 1, int(new_cap * self.factor))
+        return new_cap
+
+    def shrink(self, size: int, capacity: int) -> Optional[int]:
+        new_cap = capacity
+        while size <= int(new_cap / self.factor ** 2) and new_cap > self.min_capacity:
+            new_cap = max(self.min_capacity, int(new_cap / self.factor))
+        return new_cap if new_cap < capacity else None
+
+    def __repr__(self):
+        return f"FactorGrowth({self.factor})"
+
+
+class AdditiveGrowth(GrowthPolicy):
+    """Grow by a fixed `step` of slots; give back one step once two are unused."""
+
+    def __init__(self, step: int = 1024, min_capacity: int = 4):
+        if step <= 0:
+            raise ValueError("step must be > 0")
+        super().__init__(min_capacity)
+        self.step = step
+
+    def grow(self, capacity: int, needed: int) -> int:
+        steps = -(-(needed - capacity) // self.step)  # ceil division
+        return capacity + steps * self.step
+
+    def shrink(self, size: int, capacity: int) -> Optional[int]:
+        if capacity - size < 2 * self.step:
+            return None
+        return max(self.min_capacity, size + self.step)
+
+    def __repr__(self):
+        return f"AdditiveGrowth({self.step})"
+
+
+class HysteresisGrowth(GrowthPolicy):
+    """
+    Grow by `factor` when full; shrink only once the load drops below `low`,
+    and then straight to a load of `target`. Nothing resizes while the load
+    stays inside the [low, 1] band, so alternating append/pop never thrashes.
+    """
+
+    def __init__(self, factor: float = 2.0, low: float = 0.25, target: float = 0.5, min_capacity: int = 4):
+        if not 0 < low < target < 1:
+            raise ValueError("need 0 < low < target < 1")
+        super().__init__(min_capacity)
+        self.factor = factor
+        self.low = low
+        self.target = target
+
+    def grow(self, capacity: int, needed: int) -> int:
+        return max(needed, int(max(1, capacity) * self.factor))
+
+    def shrink(self, size: int, capacity: int) -> Optional[int]:
+        if size >= capacity * self.low:
+            return None
+        new_cap = max(self.min_capacity, math.ceil(size / self.target))
+        return new_cap if new_cap < capacity else None
+
+    def __repr__(self):
+        return f"HysteresisGrowth(factor={self.factor}, low={self.low}, target={self.target})"
+
+
+# names accepted by DynamicArray(growth=...)
+GROWTH_POLICIES = {
+    "x2": lambda: FactorGrowth(2.0),
+    "x1.5": lambda: FactorGrowth(1.5),
+    "additive": AdditiveGrowth,
+    "hysteresis": HysteresisGrowth,
+}
+
+
 class DynamicArray:
     """
     Simple dynamic array implementation that uses a Python list as underlying storage,
     but simulates capacity, doubling when full, and shrinking when underused.
 
+    Passing a numeric `typecode` (e.g. 'd' or 'q') switches storage to a compact
+    array.array: elements are stored unboxed (itemsize bytes each instead of a
+    pointer plus a Python object) under the same growth/shrink policy.
+
+    `growth` selects the capacity policy: a GrowthPolicy instance or one of the
+    GROWTH_POLICIES names ('x2' is the default). stats() reports resize counts,
+    elements copied, peak capacity and wasted slots for tuning.
+
+    A typed DynamicArray supports the buffer protocol: memoryview(da) (Python
+    3.12+) or `with da.exported() as view:` gives a zero-copy view of the live
+    elements for numpy.frombuffer, socket.sendall or file.write. While any view
+    is exported the array refuses to reallocate (BufferError, like bytearray)
+    instead of leaving the view pointing at stale storage; writes and
+    in-place updates stay visible through the view.
+
     Methods:
         - append(x)
         - pop()
         - insert(index, x)
+        - extend(items), insert_many(index, items), delete_range(start, stop)
         - __len__, __getitem__, __setitem__
+        - stats()
+    Resizes and shifts are single slice copies, not per-element Python loops.
     """
 
-    def __init__(self, initial_capacity: int = 4):
+    def __init__(self, initial_capacity: int = 4, typecode: Optional[str] = None,
+                 growth: Optional[GrowthPolicy | str] = None):
         if initial_capacity <= 0:
             initial_capacity = 4
+        if typecode is not None and typecode not in NUMERIC_TYPECODES:
+            raise ValueError(f"typecode must be one of {NUMERIC_TYPECODES!r}")
+        if growth is None:
+            growth = "x2"
+        if isinstance(growth, str):
+            if growth not in GROWTH_POLICIES:
+                raise ValueError(f"unknown growth policy {growth!r}; choose from {sorted(GROWTH_POLICIES)}")
+            growth = GROWTH_POLICIES[growth]()
+        self._growth = growth
+        self._typecode = typecode
+        # value written into unused slots
+        self._blank = None if typecode is None else 0
         self._capacity = int(initial_capacity)
         self._size = 0
-        # allocate internal storage with None placeholders up to capacity
-        self._data = [None] * self._capacity
+        # allocate internal storage with placeholders up to capacity
+        self._data = self._allocate(self._capacity)
+        self._resizes = 0
+        self._grows = 0
+        self._elements_copied = 0
+        self._peak_capacity = self._capacity
+        self._exports = 0
 
     def __len__(self) -> int:
         return self._size
 
+    @property
+    def typecode(self) -> Optional[str]:
+        return self._typecode
+
+    def _allocate(self, capacity: int):
+        """Return empty storage for `capacity` slots (list of None or zeroed array)."""
+        if self._typecode is None:
+            return [None] * capacity
+        return array(self._typecode, bytes(capacity * array(self._typecode).itemsize))
+
     def _resize(self, new_capacity: int):
         if new_capacity < self._size:
             raise ValueError("new_capacity must be >= size")
-        new_data = [None] * new_capacity
-        for i in range(self._size):
-            new_data[i] = self._data[i]
+        if self._exports:
+            raise BufferError("cannot resize DynamicArray while a buffer export is active")
+        new_data = self._allocate(new_capacity)
+        # one C-level slice copy instead of a Python loop per element
+        new_data[:self._size] = self._live_slice()
+        self._resizes += 1
+        if new_capacity > self._capacity:
+            self._grows += 1
+        self._elements_copied += self._size
+        self._peak_capacity = max(self._peak_capacity, new_capacity)
         self._data = new_data
         self._capacity = new_capacity
 
+    def _reserve(self, needed: int):
+        """Grow per the policy until at least `needed` slots exist, with a single resize."""
+        if needed > self._capacity:
+            self._resize(self._growth.grow(self._capacity, needed))
+
+    def _maybe_shrink(self):
+        # empty arrays keep their capacity, as before policies were pluggable;
+        # shrinking is optional, so skip it rather than fail while exported
+        if self._size == 0 or self._exports:
+            return
+        new_cap = self._growth.shrink(self._size, self._capacity)
+        if new_cap is not None:
+            self._resize(new_cap)
+
+    def _as_storage(self, items: Iterable[Any]):
+        """Materialize `items` as a sequence that can be slice-assigned into storage."""
+        if self._typecode is None:
+            return list(items)
+        return array(self._typecode, items)
+
+    def _clamp(self, index: int) -> int:
+        return min(max(index, 0), self._size)
+
     def append(self, item: Any):
         if self._size >= self._capacity:
-            # double capacity
-            new_cap = max(1, self._capacity * 2)
-            self._resize(new_cap)
+            self._reserve(self._size + 1)
         self._data[self._size] = item
         self._size += 1
 
-    def pop(self) -> Any:
+    def _live_slice(self):
+        """The live elements as one contiguous list/array copy."""
+        return self._data[:self._size]
+
+    def pop(self, index: Optional[int] = None) -> Any:
+        """Remove and return the last item, or the item at `index` (shifts the tail)."""
         if self._size == 0:
             raise IndexError("pop from empty DynamicArray")
+        if index is not None and index not in (-1, self._size - 1):
+            if index < 0:
+                index += self._size
+            if not 0 <= index < self._size:
+                raise IndexError("pop index out of range")
+            val = self._data[index]
+            self.delete_range(index, index + 1)
+            return val
         val = self._data[self._size - 1]
-        self._data[self._size - 1] = None
+        self._data[self._size - 1] = self._blank
         self._size -= 1
-        # shrink when quarter full to avoid thrashing
-        if self._size > 0 and self._size <= self._capacity // 4:
-            new_cap = max(4, self._capacity // 2)
-            if new_cap < self._capacity:
-                self._resize(new_cap)
+        # shrink per the policy (default: halve when quarter full) to avoid thrashing
+        self._maybe_shrink()
         return val
 
     def insert(self, index: int, item: Any):
-        if index < 0:
-            index = 0
-        if index > self._size:
-            index = self._size
+        index = self._clamp(index)
         if self._size >= self._capacity:
-            self._resize(self._capacity * 2)
-        # shift elements to right
-        i = self._size
-        while i > index:
-            self._data[i] = self._data[i - 1]
-            i -= 1
+            self._reserve(self._size + 1)
+        # shift elements to right in one memmove-style slice assignment
+        self._data[index + 1:self._size + 1] = self._data[index:self._size]
         self._data[index] = item
         self._size += 1
 
+    def extend(self, items: Iterable[Any]):
+        """Append every item with at most one resize and one bulk copy."""
+        block = self._as_storage(items)
+        k = len(block)
+        self._reserve(self._size + k)
+        self._data[self._size:self._size + k] = block
+        self._size += k
+
+    def insert_many(self, index: int, items: Iterable[Any]):
+        """Insert all `items` at `index`, shifting the tail once for the whole batch."""
+        index = self._clamp(index)
+        block = self._as_storage(items)
+        k = len(block)
+        if k == 0:
+            return
+        self._reserve(self._size + k)
+        self._data[index + k:self._size + k] = self._data[index:self._size]
+        self._data[index:index + k] = block
+        self._size += k
+
+    def delete_range(self, start: int, stop: int):
+        """Delete items [start, stop) (clamped like a slice), shifting the tail once."""
+        start = self._clamp(start)
+        stop = max(self._clamp(stop), start)
+        k = stop - start
+        if k == 0:
+            return
+        self._data[start:self._size - k] = self._data[stop:self._size]
+        self._data[self._size - k:self._size] = self._allocate(k)
+        self._size -= k
+        self._maybe_shrink()
+
     def __getitem__(self, index: int) -> Any:
         if index < 0 or index >= self._size:
             raise IndexError("index out of range")
@@ -291,11 +1166,221 @@ class DynamicArray:
     def capacity(self) -> int:
         return self._capacity
 
+    # ---------- Buffer protocol (typed mode) ----------
+    def __buffer__(self, flags: int) -> memoryview:
+        if self._typecode is None:
+            raise TypeError("only a typed DynamicArray (typecode=...) exports a buffer")
+        view = memoryview(self._data)[:self._size]
+        self._exports += 1
+        return view
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        view.release()
+        self._exports -= 1
+
+    @contextmanager
+    def exported(self) -> Iterator[memoryview]:
+        """Zero-copy memoryview of the live elements, released on exit (any Python version)."""
+        view = self.__buffer__(0)
+        try:
+            yield view
+        finally:
+            self.__release_buffer__(view)
+
+    def stats(self) -> dict:
+        """Resize instrumentation for tuning memory against copy cost."""
+        return {
+            'policy': repr(self._growth),
+            'size': self._size,
+            'capacity': self._capacity,
+            'resizes': self._resizes,
+            'grows': self._grows,
+            'shrinks': self._resizes - self._grows,
+            'elements_copied': self._elements_copied,
+            'peak_capacity': self._peak_capacity,
+            'wasted_slots': self._capacity - self._size,
+        }
+
+    def memory_bytes(self) -> int:
+        """Bytes held by the storage, including boxed element objects in list mode."""
+        total = sys.getsizeof(self._data)
+        if self._typecode is None:
+            total += sum(sys.getsizeof(x) for x in self._live_slice())
+        return total
+
     def to_list(self) -> List[Any]:
-        return [self._data[i] for i in range(self._size)]
+        return list(self._live_slice())
 
     def __repr__(self) -> str:
-        return f"DynamicArray(size={self._size}, capacity={self._capacity}, data={self.to_list()})"
+        typed = f", typecode={self._typecode!r}" if self._typecode else ""
+        return (f"{type(self).__name__}(size={self._size}, capacity={self._capacity}{typed}, "
+                f"data={self.to_list()})")
+
+
+class CircularDynamicArray(DynamicArray):
+    """
+    DynamicArray stored as a ring buffer: a head offset plus wraparound
+    indexing, so both ends are cheap.
+
+        - append(x), pop(), insert(0, x), pop(0): amortized O(1)
+        - __getitem__ / __setitem__: O(1)
+        - middle insert/pop and the batch operations: O(n) (the ring is first
+          rotated so the head sits at slot 0, then DynamicArray does the work)
+
+    Typecode, growth policy, stats() and buffer export all behave as in
+    DynamicArray. Exporting a buffer rotates the ring in place first; while a
+    view is exported the head cannot move, so insert(0)/pop(0) raise BufferError.
+    """
+
+    def __init__(self, initial_capacity: int = 4, typecode: Optional[str] = None,
+                 growth: Optional[GrowthPolicy | str] = None):
+        self._head = 0
+        super().__init__(initial_capacity, typecode, growth)
+
+    def _phys(self, index: int) -> int:
+        return (self._head + index) % self._capacity
+
+    def _live_slice(self):
+        end = self._head + self._size
+        if end <= self._capacity:
+            return self._data[self._head:end]
+        return self._data[self._head:] + self._data[:end - self._capacity]
+
+    def _resize(self, new_capacity: int):
+        super()._resize(new_capacity)  # copies the unwrapped live slice to slot 0
+        self._head = 0
+
+    def _normalize(self):
+        """Rotate in place so the head is slot 0 (storage object is kept)."""
+        if self._head:
+            h = self._head
+            self._data[:] = self._data[h:] + self._data[:h]
+            self._head = 0
+
+    def _check_head_movable(self):
+        if self._exports:
+            raise BufferError("cannot move the head of CircularDynamicArray while a buffer export is active")
+
+    def append(self, item: Any):
+        if self._size >= self._capacity:
+            self._reserve(self._size + 1)
+        self._data[self._phys(self._size)] = item
+        self._size += 1
+
+    def insert(self, index: int, item: Any):
+        index = self._clamp(index)
+        if index == self._size:
+            self.append(item)
+        elif index == 0:
+            self._check_head_movable()
+            if self._size >= self._capacity:
+                self._reserve(self._size + 1)
+            self._head = (self._head - 1) % self._capacity
+            self._data[self._head] = item
+            self._size += 1
+        else:
+            self._normalize()
+            super().insert(index, item)
+
+    def pop(self, index: Optional[int] = None) -> Any:
+        if self._size == 0:
+            raise IndexError("pop from empty DynamicArray")
+        if index is None or index in (-1, self._size - 1):
+            pos = self._phys(self._size - 1)
+            val = self._data[pos]
+            self._data[pos] = self._blank
+            self._size -= 1
+        elif index in (0, -self._size):
+            self._check_head_movable()
+            val = self._data[self._head]
+            self._data[self._head] = self._blank
+            self._head = (self._head + 1) % self._capacity
+            self._size -= 1
+        else:
+            self._normalize()
+            return super().pop(index)
+        self._maybe_shrink()
+        return val
+
+    def extend(self, items: Iterable[Any]):
+        block = self._as_storage(items)
+        k = len(block)
+        self._reserve(self._size + k)
+        start = self._phys(self._size)
+        first = min(k, self._capacity - start)
+        self._data[start:start + first] = block[:first]
+        self._data[:k - first] = block[first:]
+        self._size += k
+
+    def insert_many(self, index: int, items: Iterable[Any]):
+        self._normalize()
+        super().insert_many(index, items)
+
+    def delete_range(self, start: int, stop: int):
+        self._normalize()
+        super().delete_range(start, stop)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0 or index >= self._size:
+            raise IndexError("index out of range")
+        return self._data[self._phys(index)]
+
+    def __setitem__(self, index: int, value: Any):
+        if index < 0 or index >= self._size:
+            raise IndexError("index out of range")
+        self._data[self._phys(index)] = value
+
+    def __buffer__(self, flags: int) -> memoryview:
+        if self._typecode is None:
+            raise TypeError("only a typed DynamicArray (typecode=...) exports a buffer")
+        self._normalize()
+        return super().__buffer__(flags)
+
+
+def benchmark_bulk_copy(sizes: Iterable[int] = (10**5, 10**6, 2 * 10**6), typecode: Optional[str] = None) -> dict:
+    """
+    Before/after for the two O(n) paths in DynamicArray:
+      - resize: per-element Python loop (old _resize) vs one slice copy (new)
+      - insert(0, x): per-element while-loop shift (old insert) vs slice shift (new)
+    Returns {'sizes': [...], 'resize_loop': [...], 'resize_bulk': [...],
+             'shift_loop': [...], 'shift_bulk': [...]} in seconds.
+    """
+    results = {'sizes': [], 'resize_loop': [], 'resize_bulk': [], 'shift_loop': [], 'shift_bulk': []}
+    for n in sizes:
+        da = DynamicArray(initial_capacity=n + 1, typecode=typecode)
+        da.extend(range(n))
+        src = da._data
+
+        new_data = da._allocate(2 * n)
+        start = time.perf_counter()
+        for i in range(n):
+            new_data[i] = src[i]
+        resize_loop = time.perf_counter() - start
+
+        new_data = da._allocate(2 * n)
+        start = time.perf_counter()
+        new_data[:n] = src[:n]
+        resize_bulk = time.perf_counter() - start
+
+        start = time.perf_counter()
+        i = n
+        while i > 0:
+            src[i] = src[i - 1]
+            i -= 1
+        shift_loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        src[1:n + 1] = src[0:n]
+        shift_bulk = time.perf_counter() - start
+
+        results['sizes'].append(n)
+        results['resize_loop'].append(resize_loop)
+        results['resize_bulk'].append(resize_bulk)
+        results['shift_loop'].append(shift_loop)
+        results['shift_bulk'].append(shift_bulk)
+        print(f"n={n:8d} | resize loop={resize_loop:.4f}s bulk={resize_bulk:.5f}s "
+              f"| insert(0) shift loop={shift_loop:.4f}s bulk={shift_bulk:.5f}s")
+    return results
 
 
 # ---------------------------
@@ -319,6 +1404,24 @@ def demo_exercises():
     print("Flattened:", flat)
     assert flat == [1, 2, 3, 4, 5], "flatten_2d failed"
 
+    # iter_flatten: any depth, strings/bytes/dicts stay whole, streams lazily
+    nested = [1, [2, [3, (4, "five")], [[b"six"]]], {"k": 7}, range(8, 10)]
+    print("Deep flatten:", list(iter_flatten(nested)))
+    assert list(iter_flatten(nested)) == [1, 2, 3, 4, "five", b"six", {"k": 7}, 8, 9], "iter_flatten failed"
+    assert list(iter_flatten(nested, max_depth=1)) == [1, 2, [3, (4, "five")], [[b"six"]], {"k": 7}, 8, 9]
+    deep = [0]
+    for i in range(1, 50_000):  # far past the recursion limit
+        deep = [deep, i]
+    assert next(iter_flatten(deep)) == 0 and sum(1 for _ in iter_flatten(deep)) == 50_000
+    loop = [1, 2]
+    loop.append(loop)
+    try:
+        list(iter_flatten(loop))
+    except ValueError as e:
+        print("Self-referencing list refused:", e)
+    else:
+        raise AssertionError("iter_flatten should refuse a cycle")
+
     # count_duplicates_list_only
     arr = [1, 2, 1, 3, 2, 1]
     counts = count_duplicates_list_only(arr)
@@ -344,20 +1447,158 @@ def demo_exercises():
         print(f"popped {v}: size={len(da)}, capacity={da.capacity()}")
     print("DynamicArray final:", da)
 
+    # Typed DynamicArray: same policy, compact array.array storage
+    boxed = DynamicArray()
+    typed = DynamicArray(typecode='d')
+    for i in range(2 ** 14):  # exactly full, so capacity slack doesn't blur the comparison
+        boxed.append(i * 0.5)
+        typed.append(i * 0.5)
+    print(f"\n16384 floats: list-backed={boxed.memory_bytes()} bytes, typed('d')={typed.memory_bytes()} bytes")
+    assert typed.to_list() == boxed.to_list(), "typed DynamicArray failed"
+    assert typed.capacity() == boxed.capacity(), "typed DynamicArray should follow the same growth policy"
+    assert typed.memory_bytes() * 3 < boxed.memory_bytes(), "typed DynamicArray should be >3x smaller"
+
+    # Batch operations shift once per batch
+    batch = DynamicArray(typecode='q')
+    batch.extend(range(10))
+    batch.insert_many(3, [100, 101, 102])
+    batch.delete_range(0, 2)
+    print("After extend/insert_many/delete_range:", batch.to_list())
+    assert batch.to_list() == [2, 100, 101, 102, 3, 4, 5, 6, 7, 8, 9], "batch operations failed"
+
+    # Zero-copy export of a typed DynamicArray
+    samples = DynamicArray(initial_capacity=4, typecode='i')
+    samples.extend([1, 2, 3, 4])
+    with samples.exported() as view:
+        print("\nExported view:", view.format, view.tolist(), f"{view.nbytes} bytes, no copy")
+        samples[0] = 42  # in-place writes are visible through the view
+        assert view[0] == 42, "export should share storage"
+        try:
+            samples.append(5)  # would reallocate under the view
+            raise AssertionError("resize while exported should fail")
+        except BufferError as e:
+            print("Append while exported refused:", e)
+    samples.append(5)  # fine once the view is released
+    assert samples.to_list() == [42, 2, 3, 4, 5], "buffer export failed"
+
+    # Ring-buffer mode: sliding window pushes at the back and evicts at the front
+    window = CircularDynamicArray(initial_capacity=4, typecode='q')
+    for i in range(10):
+        window.append(i)
+        if len(window) > 3:
+            window.pop(0)
+    window.insert(0, -1)
+    print("\nSliding window (last 3 + insert(0, -1)):", window.to_list(), "capacity:", window.capacity())
+    assert window.to_list() == [-1, 7, 8, 9], "CircularDynamicArray failed"
+    assert window.stats()['resizes'] == 0, "steady-state window should not resize"
+
+    # Growth policies under the same append/pop mix
+    print("\nGrowth policies, 20000 appends then 2000 pop/append pairs:")
+    for name in GROWTH_POLICIES:
+        arr = DynamicArray(growth=name)
+        ops = 0
+        for i in range(20_000):
+            arr.append(i)
+            ops += 1
+        for _ in range(2_000):
+            arr.pop()
+            arr.append(0)
+            ops += 2
+        st = arr.stats()
+        print(f"  {name:>10}: resizes={st['resizes']:4d} copied/op={st['elements_copied'] / ops:.2f} "
+              f"peak={st['peak_capacity']} wasted={st['wasted_slots']}")
+        if name != "additive":
+            # geometric growth keeps appends amortized O(1)
+            assert st['elements_copied'] <= 3 * ops, f"{name}: growth not amortized O(1)"
+
+    # Regression detection: a clear 5x slowdown must be flagged, an identical run must not
+    def fake_run(scale):
+        values = [[t * scale for t in (1.0e-6, 1.1e-6, 0.9e-6, 1.05e-6, 0.95e-6)]]
+        return {'sizes': [1000], 'append': [statistics.median(values[0])],
+                'stats': {'append': [summarize_samples(values[0]) | {'values': values[0]}]}}
+    assert compare_results(fake_run(1), fake_run(5))[0]['slowdown'], "5x regression not flagged"
+    assert not compare_results(fake_run(1), fake_run(1))[0]['slowdown'], "identical runs flagged"
+
+    # Complexity fitting: synthetic curves must be classified correctly...
+    sizes = [1000, 4000, 16000, 64000]
+    jitter = [1.03, 0.97, 1.02, 0.98]
+    assert fit_complexity(sizes, [5e-8 * j for j in jitter])['best'] == 'O(1)'
+    assert fit_complexity(sizes, [(1e-7 + 2e-10 * n) * j for n, j in zip(sizes, jitter)])['best'] == 'O(n)'
+    assert fit_complexity(sizes, [1e-9 * n * n for n in sizes])['best'] == 'O(n^2)'
+    try:
+        check_complexity({'append': fit_complexity(sizes, [2e-10 * n for n in sizes])}, {'append': 'O(1)'})
+    except AssertionError as e:
+        print("\nDrift to linear detected as expected:", e)
+    else:
+        raise AssertionError("check_complexity missed a linear drift")
+
+    # ...and DynamicArray.append, claimed amortized O(1), must measure that way:
+    # per-append cost of n appends from empty, so every resize is paid for
+    def fill(n):
+        arr = DynamicArray()
+        for i in range(n):
+            arr.append(i)
+
+    da_times = [time_operation(lambda n=n: fill(n), repeats=3) / n for n in sizes]
+    fits = {'append': fit_complexity(sizes, da_times)}
+    print("DynamicArray.append fit:", fits['append']['best'])
+    check_complexity(fits, {'append': 'O(1)'})
+
     # final confirm
     print("\nAll demos/tests ran (asserts passed).")
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DSA Session 2 demo and list-operation profiler.")
+    parser.add_argument('--save', metavar='PATH', help="save profile results (.json or .csv)")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help="compare two saved result files and exit (status 1 on slowdowns)")
+    parser.add_argument('--alpha', type=float, default=0.05, help="significance level for --compare")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="run size/operation cells in this many worker processes")
+    parser.add_argument('--pin', action='store_true', help="pin each worker to its own CPU core (Linux)")
+    parser.add_argument('--memory', action='store_true',
+                        help="also record tracemalloc peak, net live blocks (per call and per batch) and getsizeof growth")
+    parser.add_argument('--headless', action='store_true',
+                        help="don't open a plot window; write the plot/results files instead (Agg backend)")
+    parser.add_argument('--formats', nargs='+', default=list(PLOT_FORMATS), choices=PLOT_FORMATS,
+                        help="files to write with --headless")
+    parser.add_argument('--plot-prefix', default='list_ops_profile', help="output path without extension")
+    parser.add_argument('--min-change', type=float, default=0.05,
+                        help="minimum relative slowdown to flag for --compare (0.05 = 5%%)")
+    parser.add_argument('--bulk-copy', action='store_true',
+                        help="time DynamicArray's per-element loop vs slice copy (resize / insert(0) shift) and exit")
+    args = parser.parse_args(argv)
+
+    if args.bulk_copy:
+        print("DynamicArray bulk copy: per-element loop vs slice copy")
+        benchmark_bulk_copy()
+        return 0
+
+    if args.compare:
+        (old_meta, old), (new_meta, new) = (load_results(p) for p in args.compare)
+        print(f"old: {old_meta.get('timestamp', '?')} Python {old_meta.get('python', '?')} {old_meta.get('machine', '')}")
+        print(f"new: {new_meta.get('timestamp', '?')} Python {new_meta.get('python', '?')} {new_meta.get('machine', '')}")
+        rows = compare_results(old, new, alpha=args.alpha, min_change=args.min_change)
+        print_comparison(rows)
+        return 1 if any(r['slowdown'] for r in rows) else 0
+
     print("DSA Session 2 - Advanced Arrays & Lists - demo and profiler\n")
 
     # 1) Profile list operations
     sizes = [1000, 5000, 10000, 20000, 40000]  # adjust these as needed
     print("Profiling list operations for sizes:", sizes)
-    results = profile_list_operations(sizes, repeats=3)
-
-    # 2) Plot (if available)
-    plot_profile(results, save_path="list_ops_profile.png" if MATPLOTLIB_AVAILABLE else None)
+    # 5 samples per cell: 3 vs 3 can never reach p <= 0.05 in --compare
+    results = profile_list_operations(sizes, repeats=5, workers=args.workers, pin=args.pin,
+                                      memory=args.memory)
+    if args.save:
+        save_results(results, args.save)
+
+    # 2) Plot (if available); --headless writes files instead of opening a window
+    if args.headless:
+        export_profile(results, args.plot_prefix, args.formats)
+    else:
+        plot_profile(results, save_path=f"{args.plot_prefix}.png" if MATPLOTLIB_AVAILABLE else None)
 
     # 3) Discussion hint (printed)
     print("\nDiscussion (short):")
@@ -368,6 +1609,11 @@ def main():
     print(" - pop() at end is O(1); pop(0) is O(n) for same reason as insert(0).")
     print("\nSee the plotted timing results to observe how insert(0) and pop(0) grow linearly with n.\n")
 
+    # 3b) Check those claims against the measurements
+    print("Measured complexity (best-fitting model per operation):")
+    print_complexity(analyze_complexity(results))
+    print()
+
     # 4) Run exercises demo & tests
     demo_exercises()
 
@@ -382,8 +1628,9 @@ def main():
         print("After append(c) -> capacity should increase:", da)
     except Exception as e:
         print("Interactive DynamicArray demo failed:", e)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+tiered_vector.py
+
+Tiered vector: a sequence stored as a list of fixed-size circular chunks
+(collections.deque). Every chunk except the last holds exactly `chunk_size`
+items, so position i lives at chunk i // chunk_size, offset i % chunk_size.
+
+With chunk_size ~ sqrt(n):
+ - __getitem__ / __setitem__: O(1) chunk lookup + deque index within one chunk
+ - insert(index, x) / pop(index) / delete(index): O(sqrt n) -- shift inside one
+   chunk, then move one item across each following chunk boundary, which is
+   O(1) per chunk because the chunks are circular
+ - append / pop(): amortized O(1)
+The chunk size is doubled or halved (one O(n) rebuild) as n crosses
+4 * chunk_size^2 or chunk_size^2 / 4, keeping the sqrt(n) balance amortized.
+
+Same interface as DynamicArray: append, pop, insert, __len__, __getitem__,
+__setitem__, to_list.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from collections import deque
+from typing import Any, Iterable, Iterator, List, Optional
+
+from solution import DynamicArray
+
+MIN_CHUNK = 16
+
+
+class TieredVector:
+    """Sequence with O(sqrt n) middle insert/delete and near-O(1) indexing."""
+
+    def __init__(self, items: Iterable[Any] = (), chunk_size: int = MIN_CHUNK):
+        self._chunk = max(2, chunk_size)
+        self._chunks: List[deque] = []
+        self._size = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def chunk_size(self) -> int:
+        return self._chunk
+
+    # ---------- Internal helpers ----------
+    def _locate(self, index: int):
+        if index < 0 or index >= self._size:
+            raise IndexError("index out of range")
+        c, offset = divmod(index, self._chunk)
+        return self._chunks[c], offset
+
+    def _rebuild(self, chunk_size: int) -> None:
+        items = list(self)
+        self._chunk = chunk_size
+        self._chunks = [deque(items[i:i + chunk_size]) for i in range(0, len(items), chunk_size)]
+
+    def _rebalance(self) -> None:
+        k = self._chunk
+        if self._size > 4 * k * k:
+            self._rebuild(k * 2)
+        elif k > MIN_CHUNK and self._size < k * k // 4:
+            self._rebuild(max(MIN_CHUNK, k // 2))
+
+    # ---------- Public API ----------
+    def append(self, item: Any) -> None:
+        if not self._chunks or len(self._chunks[-1]) >= self._chunk:
+            self._chunks.append(deque())
+        self._chunks[-1].append(item)
+        self._size += 1
+        self._rebalance()
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.append(item)
+
+    def insert(self, index: int, item: Any) -> None:
+        """Insert before `index` (clamped to [0, len]), O(sqrt n)."""
+        index = min(max(index, 0), self._size)
+        if index == self._size:
+            self.append(item)
+            return
+        chunks = self._chunks
+        c, offset = divmod(index, self._chunk)
+        chunks[c].insert(offset, item)
+        # push one overflow item into each following chunk (O(1) per chunk)
+        for j in range(c, len(chunks) - 1):
+            chunks[j + 1].appendleft(chunks[j].pop())
+        if len(chunks[-1]) > self._chunk:
+            chunks.append(deque([chunks[-1].pop()]))
+        self._size += 1
+        self._rebalance()
+
+    def pop(self, index: Optional[int] = None) -> Any:
+        """Remove and return the last item, or the item at `index`, O(sqrt n)."""
+        if self._size == 0:
+            raise IndexError("pop from empty TieredVector")
+        if index is None:
+            index = self._size - 1
+        elif index < 0:
+            index += self._size
+        chunk, offset = self._locate(index)
+        chunks = self._chunks
+        c = index // self._chunk
+        value = chunk[offset]
+        del chunk[offset]
+        # pull one item back from each following chunk (O(1) per chunk)
+        for j in range(c, len(chunks) - 1):
+            chunks[j].append(chunks[j + 1].popleft())
+        if not chunks[-1]:
+            chunks.pop()
+        self._size -= 1
+        self._rebalance()
+        return value
+
+    def delete(self, index: int) -> None:
+        self.pop(index)
+
+    def __getitem__(self, index: int) -> Any:
+        chunk, offset = self._locate(index)
+        return chunk[offset]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        chunk, offset = self._locate(index)
+        chunk[offset] = value
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"TieredVector(size={self._size}, chunk_size={self._chunk}, chunks={len(self._chunks)})"
+
+
+# -----
+# Benchmark
+# -----
+
+
+def _consume(iterable) -> None:
+    for _ in iterable:
+        pass
+
+
+def register_benchmarks(register) -> None:
+    """bench.py hook: the container_bench case names (bench.CASE_NAMES)."""
+    setup = lambda n: TieredVector(range(n))
+    register("TieredVector", "head_insert", setup, lambda tv: tv.insert(0, -1))
+    register("TieredVector", "tail_insert", setup, lambda tv: tv.append(-1))
+    register("TieredVector", "middle_insert", setup, lambda tv: tv.insert(len(tv) // 2, -1))
+    register("TieredVector", "pop_head", setup, lambda tv: tv.pop(0) if len(tv) else None)
+    register("TieredVector", "pop_tail", setup, lambda tv: tv.pop() if len(tv) else None)
+    register("TieredVector", "search", setup, lambda tv: -2 in tv)
+    register("TieredVector", "iterate", setup, _consume)
+
+
+def benchmark_middle_inserts(n: int = 100_000, seed: int = 0) -> dict:
+    """Time n random-position inserts followed by n random reads."""
+    rng = random.Random(seed)
+    positions = [rng.randrange(i + 1) for i in range(n)]
+    reads = [rng.randrange(n) for _ in range(n)]
+
+    results = {}
+    for name, container in (("TieredVector", TieredVector()), ("DynamicArray", DynamicArray()), ("list", [])):
+        start = time.perf_counter()
+        for i, pos in enumerate(positions):
+            container.insert(pos, i)
+        t_insert = time.perf_counter() - start
+        start = time.perf_counter()
+        for pos in reads:
+            container[pos]
+        t_read = time.perf_counter() - start
+        results[name] = {"insert": t_insert, "read": t_read}
+        print(f"{name:>13}: {n} random inserts={t_insert:.3f}s | {n} random reads={t_read:.3f}s")
+    return results
+
+
+def demo_tiered_vector():
+    print("=== TieredVector demo ===")
+    tv = TieredVector(range(10), chunk_size=4)
+    tv.insert(5, 99)
+    tv.pop(0)
+    tv[0] = -1
+    print(tv, tv.to_list())
+    assert tv.to_list() == [-1, 2, 3, 4, 99, 5, 6, 7, 8, 9]
+    print(f"sqrt-balanced chunk size at n=100000: {TieredVector(range(100_000)).chunk_size()} "
+          f"(sqrt = {math.isqrt(100_000)})")
+
+
+if __name__ == "__main__":
+    demo_tiered_vector()
+    print()
+    benchmark_middle_inserts(n=30_000)
@@ -22,17 +22,18 @@ class Stack:
         return len(self.items)
 
 
-# instance
-stack = Stack()  # object initialization
+if __name__ == "__main__":
+    # instance
+    stack = Stack()  # object initialization
 
-stack.push(2)
-stack.push(4)
-stack.push(9)
+    stack.push(2)
+    stack.push(4)
+    stack.push(9)
 
-print(stack.peek())  # 9
-# stack.pop()
-# stack.pop()
-# stack.pop()
+    print(stack.peek())  # 9
+    # stack.pop()
+    # stack.pop()
+    # stack.pop()
 
-for item in stack.items:
-    print(item)
+    for item in stack.items:
+        print(item)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+array_linked_list.py
+
+Index-linked variant of the Session 4 LinkedList.
+
+Instead of one Python object per node, the list keeps:
+ - _data: a Python list holding each slot's value
+ - _next: an array('q') holding the index of the next slot (-1 = None)
+Freed slots are chained through _next into a free-slot list and reused by
+later inserts, so the two buffers only grow when every slot is in use.
+
+Exposes the same API as linked_lists.LinkedList:
+ - insert_at_beginning, insert_at_end
+ - insert_at_position, delete_by_value
+ - search, count_nodes, print_list
+ - reverse (in-place)
+ - to_list, clear
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any
+
+from linked_lists import LinkedList, Node
+
+NIL = -1
+
+
+class ArrayLinkedList:
+    """Singly linked list stored in parallel data / next-index buffers."""
+
+    def __init__(self):
+        self._data: list = []
+        self._next = array("q")
+        self._free: int = NIL  # head of the free-slot chain
+        self.head: int = NIL
+        self.tail: int = NIL
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ---------- Slot management ----------
+    def _alloc(self, data: Any) -> int:
+        """Return a slot index holding `data`, reusing a free slot if possible."""
+        slot = self._free
+        if slot != NIL:
+            self._free = self._next[slot]
+            self._data[slot] = data
+            self._next[slot] = NIL
+            return slot
+        self._data.append(data)
+        self._next.append(NIL)
+        return len(self._data) - 1
+
+    def _release(self, slot: int) -> None:
+        self._data[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+
+    # ---------- Insertion ----------
+    def insert_at_beginning(self, data: Any) -> None:
+        """Insert new slot at the head (O(1))."""
+        slot = self._alloc(data)
+        self._next[slot] = self.head
+        self.head = slot
+        if self.tail == NIL:
+            self.tail = slot
+        self._size += 1
+
+    def insert_at_end(self, data: Any) -> None:
+        """Insert new slot at the tail (O(1))."""
+        slot = self._alloc(data)
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+        self.tail = slot
+        self._size += 1
+
+    def insert_at_position(self, index: int, data: Any) -> None:
+        """
+        Insert at specified index (0-based).
+        If index <= 0 => insert at beginning.
+        If index >= length => insert at end.
+        """
+        if index <= 0 or self.head == NIL:
+            self.insert_at_beginning(data)
+            return
+        if index >= self._size:
+            self.insert_at_end(data)
+            return
+
+        nxt = self._next
+        cur = self.head
+        for _ in range(index - 1):
+            cur = nxt[cur]
+        slot = self._alloc(data)
+        nxt[slot] = nxt[cur]
+        nxt[cur] = slot
+        self._size += 1
+
+    # ---------- Deletion ----------
+    def delete_by_value(self, value: Any) -> bool:
+        """
+        Delete first slot with given value.
+        Returns True if deleted, False if not found.
+        """
+        data, nxt = self._data, self._next
+        prev = NIL
+        cur = self.head
+        while cur != NIL:
+            if data[cur] == value:
+                if prev == NIL:
+                    self.head = nxt[cur]
+                else:
+                    nxt[prev] = nxt[cur]
+                if cur == self.tail:
+                    self.tail = prev
+                self._size -= 1
+                self._release(cur)
+                return True
+            prev = cur
+            cur = nxt[cur]
+        return False
+
+    # ---------- Query ----------
+    def search(self, value: Any) -> bool:
+        """Return True if value exists in the list."""
+        data, nxt = self._data, self._next
+        cur = self.head
+        while cur != NIL:
+            if data[cur] == value:
+                return True
+            cur = nxt[cur]
+        return False
+
+    def count_nodes(self) -> int:
+        """Return number of stored values (O(1))."""
+        return self._size
+
+    def to_list(self) -> list:
+        """Utility: return Python list of values in list order."""
+        data, nxt = self._data, self._next
+        out = []
+        cur = self.head
+        while cur != NIL:
+            out.append(data[cur])
+            cur = nxt[cur]
+        return out
+
+    # ---------- Traversal / Display ----------
+    def print_list(self) -> None:
+        """Nicely print the list contents."""
+        parts = [str(x) for x in self.to_list()]
+        parts.append("None")
+        print(" -> ".join(parts))
+
+    # ---------- Reverse ----------
+    def reverse(self) -> None:
+        """Reverse the list in-place by rewriting the next indices."""
+        nxt = self._next
+        prev = NIL
+        cur = self.head
+        self.tail = cur
+        while cur != NIL:
+            following = nxt[cur]
+            nxt[cur] = prev
+            prev = cur
+            cur = following
+        self.head = prev
+
+    # ---------- Utilities ----------
+    def clear(self) -> None:
+        """Clear the list and release both buffers."""
+        self.__init__()
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes used by the two buffers (values themselves excluded)."""
+        return sys.getsizeof(self._data) + sys.getsizeof(self._next)
+
+
+# -----
+# Demo
+# -----
+
+
+def demo_array_linked_list():
+    print("=== ArrayLinkedList demo ===")
+    ll = ArrayLinkedList()
+    for v in (10, 20, 30):
+        ll.insert_at_end(v)
+    ll.insert_at_beginning(5)
+    ll.insert_at_position(2, 15)
+    ll.print_list()  # expected: 5 -> 10 -> 15 -> 20 -> 30 -> None
+    print("Found 20?", ll.search(20))
+    ll.delete_by_value(15)
+    ll.insert_at_end(40)  # reuses the slot freed by 15
+    ll.reverse()
+    ll.print_list()  # expected: 40 -> 30 -> 20 -> 10 -> 5 -> None
+    assert ll.to_list() == [40, 30, 20, 10, 5]
+    assert len(ll._data) == 5, "freed slot should have been reused"
+
+
+def demo_memory_comparison(n: int = 1_000_000):
+    print(f"\n=== Memory for {n} ints: object graph vs index-linked ===")
+    node_bytes = n * sys.getsizeof(Node(0))
+    arr = ArrayLinkedList()
+    for i in range(n):
+        arr.insert_at_end(i)
+    print(f"LinkedList nodes:     ~{node_bytes / 1e6:.1f} MB")
+    print(f"ArrayLinkedList bufs: ~{arr.memory_bytes() / 1e6:.1f} MB")
+
+    ll = LinkedList()
+    for i in range(n):
+        ll.insert_at_end(i)
+    assert ll.to_list() == arr.to_list()
+
+
+if __name__ == "__main__":
+    demo_array_linked_list()
+    demo_memory_comparison()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+indexed_linked_list.py
+
+Opt-in hash-indexed variant of the Session 4 LinkedList.
+
+Nodes are doubly linked (each keeps `prev`), and a dict maps every value to
+the node(s) holding it. Every mutator keeps the index in sync, so:
+ - search / `in`: O(1) average
+ - delete_by_value: O(1 + k) average, where k is the number of copies of
+   the value (O(1) for unique values). Every node carries an integer order
+   label that increases along the list, so the *first* copy in list order,
+   the one LinkedList would delete, is the bucket entry with the smallest
+   label -- no walk from the head, even with duplicates.
+Values must be hashable.
+
+Labels are spaced LABEL_GAP apart; an insert between two nodes takes the
+midpoint, and when a gap is used up the whole list is relabelled. That
+O(n) pass only happens inside insert_at_position, which already walks O(n).
+
+Cost: one extra pointer and label per node plus a dict entry and a small
+bucket dict per distinct value -- see benchmark_index() for numbers.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, Optional
+
+from linked_lists import LinkedList
+
+LABEL_GAP = 1 << 32
+
+
+class IndexedNode:
+    """A node with both neighbours, so it can unlink itself in O(1)."""
+
+    __slots__ = ("data", "prev", "next", "label")
+
+    def __init__(self, data: Any):
+        self.data: Any = data
+        self.prev: Optional[IndexedNode] = None
+        self.next: Optional[IndexedNode] = None
+        self.label = 0  # increases along the list; orders duplicates in O(1)
+
+    def __repr__(self):
+        return f"IndexedNode({self.data!r})"
+
+
+class IndexedLinkedList:
+    """LinkedList API backed by a doubly linked list plus a value -> nodes index."""
+
+    def __init__(self):
+        self.head: Optional[IndexedNode] = None
+        self.tail: Optional[IndexedNode] = None
+        self._size = 0
+        # value -> its nodes; a dict used as an ordered set, so removal is O(1)
+        self._index: Dict[Any, Dict[IndexedNode, None]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._index
+
+    def __iter__(self) -> Iterator[Any]:
+        cur = self.head
+        while cur:
+            yield cur.data
+            cur = cur.next
+
+    # ---------- Index / link helpers ----------
+    def _add(self, node: IndexedNode) -> None:
+        bucket = self._index.get(node.data)
+        if bucket is None:
+            self._index[node.data] = {node: None}
+        else:
+            bucket[node] = None
+        self._size += 1
+
+    def _relabel(self) -> None:
+        label = 0
+        cur = self.head
+        while cur:
+            cur.label = label
+            label += LABEL_GAP
+            cur = cur.next
+
+    def _label_between(self, prev: Optional[IndexedNode], nxt: Optional[IndexedNode]) -> int:
+        if prev is None and nxt is None:
+            return 0
+        if prev is None:
+            return nxt.label - LABEL_GAP
+        if nxt is None:
+            return prev.label + LABEL_GAP
+        if nxt.label - prev.label < 2:
+            self._relabel()
+        return (prev.label + nxt.label) // 2
+
+    def _link_after(self, prev: Optional[IndexedNode], node: IndexedNode) -> None:
+        """Link `node` after `prev` (or at the head when prev is None)."""
+        nxt = self.head if prev is None else prev.next
+        node.label = self._label_between(prev, nxt)
+        node.prev = prev
+        node.next = nxt
+        if prev is None:
+            self.head = node
+        else:
+            prev.next = node
+        if nxt is None:
+            self.tail = node
+        else:
+            nxt.prev = node
+        self._add(node)
+
+    def _unlink(self, node: IndexedNode) -> None:
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        bucket = self._index[node.data]
+        if len(bucket) == 1:
+            del self._index[node.data]
+        else:
+            del bucket[node]
+        node.prev = node.next = None
+        self._size -= 1
+
+    # ---------- Insertion ----------
+    def insert_at_beginning(self, data: Any) -> None:
+        self._link_after(None, IndexedNode(data))
+
+    def insert_at_end(self, data: Any) -> None:
+        self._link_after(self.tail, IndexedNode(data))
+
+    def insert_at_position(self, index: int, data: Any) -> None:
+        """
+        Insert at specified index (0-based).
+        If index <= 0 => insert at beginning.
+        If index >= length => insert at end.
+        """
+        if index <= 0 or self.head is None:
+            self.insert_at_beginning(data)
+            return
+        if index >= self._size:
+            self.insert_at_end(data)
+            return
+        cur = self.head
+        for _ in range(index - 1):
+            cur = cur.next
+        self._link_after(cur, IndexedNode(data))
+
+    # ---------- Deletion ----------
+    def delete_by_value(self, value: Any) -> bool:
+        """
+        Delete first node with given value.
+        Returns True if deleted, False if not found.
+        """
+        bucket = self._index.get(value)
+        if bucket is None:
+            return False
+        if len(bucket) == 1:
+            self._unlink(next(iter(bucket)))
+            return True
+        # duplicates: keep LinkedList semantics by removing the first in list order
+        self._unlink(min(bucket, key=lambda node: node.label))
+        return True
+
+    # ---------- Query ----------
+    def search(self, value: Any) -> bool:
+        """Return True if value exists in the list (O(1) average)."""
+        return value in self._index
+
+    def count_nodes(self) -> int:
+        return self._size
+
+    def to_list(self) -> list:
+        return list(self)
+
+    def print_list(self) -> None:
+        parts = [str(x) for x in self]
+        parts.append("None")
+        print(" -> ".join(parts))
+
+    # ---------- Reverse ----------
+    def reverse(self) -> None:
+        """Swap prev/next on every node and negate labels; the index needs no changes."""
+        cur = self.head
+        while cur:
+            cur.prev, cur.next = cur.next, cur.prev
+            cur.label = -cur.label
+            cur = cur.prev
+        self.head, self.tail = self.tail, self.head
+
+    # ---------- Utilities ----------
+    def clear(self) -> None:
+        self.head = None
+        self.tail = None
+        self._size = 0
+        self._index = {}
+
+
+# -----
+# Benchmark
+# -----
+
+
+def benchmark_index(n: int = 5_000, seed: int = 0, copies: int = 1) -> dict:
+    """
+    Dedupe-style workload: for n incoming records, check membership and
+    delete-by-value against a list of n items in which every value appears
+    `copies` times (copies > 1 exercises the duplicate path). Reports time and
+    the memory tracemalloc attributes to building each container.
+    """
+    rng = random.Random(seed)
+    values = [i // copies for i in range(n)]
+    lookups = [rng.randrange(2 * n // copies) for _ in range(n)]
+
+    results = {}
+    for name, factory in (("LinkedList", LinkedList), ("IndexedLinkedList", IndexedLinkedList)):
+        tracemalloc.start()
+        container = factory()
+        for v in values:
+            container.insert_at_end(v)
+        mem, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for v in lookups:
+            if container.search(v):
+                container.delete_by_value(v)
+        elapsed = time.perf_counter() - start
+        results[name] = {"seconds": elapsed, "bytes": mem}
+        print(f"{name:>18}: search+delete x{n} = {elapsed:.4f}s | build memory = {mem / 1e6:.2f} MB")
+
+    base, indexed = results["LinkedList"], results["IndexedLinkedList"]
+    print(f"Speedup: {base['seconds'] / indexed['seconds']:.0f}x, "
+          f"memory: {indexed['bytes'] / base['bytes']:.1f}x")
+    return results
+
+
+def demo_indexed():
+    print("=== IndexedLinkedList demo ===")
+    ll = IndexedLinkedList()
+    for v in (10, 20, 30, 20):
+        ll.insert_at_end(v)
+    ll.insert_at_position(1, 15)
+    ll.print_list()  # 10 -> 15 -> 20 -> 30 -> 20 -> None
+    print("20 in list?", 20 in ll, "| 99 in list?", ll.search(99))
+    ll.delete_by_value(20)  # removes the first 20
+    ll.reverse()
+    ll.print_list()  # 20 -> 30 -> 15 -> 10 -> None
+    assert ll.to_list() == [20, 30, 15, 10]
+
+
+if __name__ == "__main__":
+    demo_indexed()
+    print("\n=== Dedupe benchmark, n=5000 ===")
+    benchmark_index()
+    print("\n=== Same, every value present 4 times (delete is O(1 + k), k = 4) ===")
+    benchmark_index(copies=4)
@@ -11,17 +11,31 @@ Implements:
  - search, count_nodes, print_list
  - reverse (in-place)
  - to_list (utility)
+The list keeps a tail pointer and a size counter, so insert_at_end,
+count_nodes and len() are O(1).
+Nodes use __slots__, and an optional NodePool recycles nodes freed by
+delete_by_value / clear instead of handing them to the GC.
+Bulk helpers: from_iterable, extend, splice, merge_sorted and an in-place
+bottom-up merge sort (sort) that relinks nodes without allocating.
+Iteration is lazy: __iter__, __reversed__ (O(sqrt n) extra memory), window
+(islice-style) and a print_list that streams chunks to any file-like object.
 Includes demo / test runs at the bottom.
 """
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import math
+import sys
+import tracemalloc
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, TextIO, Tuple
 
 
 class Node:
     """A node in a singly linked list."""
 
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any):
         self.data: Any = data
         self.next: Optional[Node] = None
@@ -30,29 +44,79 @@ class Node:
         return f"Node({self.data!r})"
 
 
+class NodePool:
+    """
+    Free list of released Node objects, chained through their own `next` field.
+    acquire() reuses a pooled node when one is available, so high insert/delete
+    churn does not allocate a fresh object per insert (and the pool itself
+    never allocates either).
+    """
+
+    def __init__(self, max_size: int = 1_000_000):
+        self.max_size = max_size
+        self._free: Optional[Node] = None
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def acquire(self, data: Any) -> Node:
+        node = self._free
+        if node is None:
+            return Node(data)
+        self._free = node.next
+        self._count -= 1
+        node.data = data
+        node.next = None
+        return node
+
+    def release(self, node: Node) -> None:
+        # drop the payload so pooled nodes keep nothing alive
+        node.data = None
+        if self._count < self.max_size:
+            node.next = self._free
+            self._free = node
+            self._count += 1
+        else:
+            node.next = None
+
+
 class LinkedList:
     """Singly linked list with common operations."""
 
-    def __init__(self):
+    def __init__(self, pool: Optional[NodePool] = None):
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
+        self._size: int = 0
+        self.pool = pool
+
+    def _new_node(self, data: Any) -> Node:
+        if self.pool is not None:
+            return self.pool.acquire(data)
+        return Node(data)
+
+    def __len__(self) -> int:
+        return self._size
 
     # ---------- Insertion ----------
     def insert_at_beginning(self, data: Any) -> None:
         """Insert new node at the head (O(1))."""
-        new_node = Node(data)
+        new_node = self._new_node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._size += 1
 
     def insert_at_end(self, data: Any) -> None:
-        """Insert new node at the tail (O(n) unless tail stored)."""
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-            return
-        cur = self.head
-        while cur.next:
-            cur = cur.next
-        cur.next = new_node
+        """Insert new node at the tail (O(1), uses the stored tail)."""
+        new_node = self._new_node(data)
+        if self.tail is None:
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+        self._size += 1
 
     def insert_at_position(self, index: int, data: Any) -> None:
         """
@@ -63,17 +127,151 @@ class LinkedList:
         if index <= 0 or not self.head:
             self.insert_at_beginning(data)
             return
+        if index >= self._size:
+            self.insert_at_end(data)
+            return
 
-        new_node = Node(data)
+        new_node = self._new_node(data)
         cur = self.head
         pos = 0
-        # Stop at node before desired position or at last node
-        while cur.next and pos < index - 1:
+        # Stop at node before desired position (never the tail here)
+        while pos < index - 1:
             cur = cur.next
             pos += 1
         # insert after cur
         new_node.next = cur.next
         cur.next = new_node
+        self._size += 1
+
+    # ---------- Bulk construction ----------
+    @classmethod
+    def from_iterable(cls, values: Iterable[Any], pool: Optional[NodePool] = None) -> LinkedList:
+        """Build a list from `values` in one pass."""
+        ll = cls(pool=pool)
+        ll.extend(values)
+        return ll
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Append every value from `values` in one pass (O(k))."""
+        if values is self:
+            values = list(values)  # snapshot, or we would walk the chain we are growing
+        tail = self.tail
+        added = 0
+        for data in values:
+            new_node = self._new_node(data)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            added += 1
+        self.tail = tail
+        self._size += added
+
+    def splice(self, other: LinkedList, index: int) -> None:
+        """
+        Move all nodes of `other` into this list at `index` (0-based, clamped).
+        No nodes are copied: after walking to the position the relink is O(1).
+        `other` is left empty.
+        """
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+        if other.head is None:
+            return
+        if index <= 0 or self.head is None:
+            other.tail.next = self.head
+            self.head = other.head
+            if self.tail is None:
+                self.tail = other.tail
+        elif index >= self._size:
+            self.tail.next = other.head
+            self.tail = other.tail
+        else:
+            cur = self.head
+            for _ in range(index - 1):
+                cur = cur.next
+            other.tail.next = cur.next
+            cur.next = other.head
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+
+    # ---------- Sorting / merging ----------
+    @staticmethod
+    def _merge_nodes(a: Optional[Node], b: Optional[Node]) -> Tuple[Optional[Node], Optional[Node]]:
+        """Stable merge of two sorted node chains; returns (head, tail)."""
+        if a is None or b is None:
+            head = a or b
+            tail = head
+            while tail is not None and tail.next is not None:
+                tail = tail.next
+            return head, tail
+        if b.data < a.data:
+            head, b = b, b.next
+        else:
+            head, a = a, a.next
+        tail = head
+        while a is not None and b is not None:
+            if b.data < a.data:
+                tail.next, b = b, b.next
+            else:
+                tail.next, a = a, a.next
+            tail = tail.next
+        tail.next = a if a is not None else b
+        while tail.next is not None:
+            tail = tail.next
+        return head, tail
+
+    @staticmethod
+    def _split_after(node: Optional[Node], count: int) -> Optional[Node]:
+        """Cut the chain after `count` nodes and return the remainder."""
+        for _ in range(count - 1):
+            if node is None:
+                return None
+            node = node.next
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        return rest
+
+    @classmethod
+    def merge_sorted(cls, a: LinkedList, b: LinkedList) -> LinkedList:
+        """
+        Merge two sorted lists into a new sorted list by relinking their nodes
+        (no new nodes). `a` and `b` are left empty.
+        """
+        if a is b:
+            raise ValueError("cannot merge a list with itself")
+        merged = cls(pool=a.pool)
+        merged.head, merged.tail = cls._merge_nodes(a.head, b.head)
+        merged._size = a._size + b._size
+        for ll in (a, b):
+            ll.head = ll.tail = None
+            ll._size = 0
+        return merged
+
+    def sort(self) -> None:
+        """
+        Stable in-place bottom-up merge sort, O(n log n) time, O(1) extra space.
+        Nodes are relinked, never copied or allocated.
+        """
+        width = 1
+        while width < self._size:
+            cur = self.head
+            new_head = new_tail = None
+            while cur is not None:
+                left = cur
+                right = self._split_after(left, width)
+                cur = self._split_after(right, width)
+                head, tail = self._merge_nodes(left, right)
+                if new_tail is None:
+                    new_head = head
+                else:
+                    new_tail.next = head
+                new_tail = tail
+            self.head, self.tail = new_head, new_tail
+            width *= 2
 
     # ---------- Deletion ----------
     def delete_by_value(self, value: Any) -> bool:
@@ -91,6 +289,11 @@ class LinkedList:
                     self.head = cur.next
                 else:
                     prev.next = cur.next
+                if cur is self.tail:
+                    self.tail = prev
+                self._size -= 1
+                if self.pool is not None:
+                    self.pool.release(cur)
                 return True
             prev = cur
             cur = cur.next
@@ -107,33 +310,65 @@ class LinkedList:
         return False
 
     def count_nodes(self) -> int:
-        """Return number of nodes."""
-        count = 0
-        cur = self.head
-        while cur:
-            count += 1
-            cur = cur.next
-        return count
+        """Return number of nodes (O(1), uses the cached size)."""
+        return self._size
 
     def to_list(self) -> list:
         """Utility: return Python list of node data."""
-        out = []
+        return list(self)
+
+    # ---------- Traversal / Display ----------
+    def __iter__(self) -> Iterator[Any]:
+        """Yield node data lazily from head to tail."""
         cur = self.head
         while cur:
-            out.append(cur.data)
+            yield cur.data
             cur = cur.next
-        return out
 
-    # ---------- Traversal / Display ----------
-    def print_list(self) -> None:
-        """Nicely print the list contents."""
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Yield node data from tail to head.
+        Keeps a checkpoint every ~sqrt(n) nodes, then replays one segment at a
+        time, so extra memory is O(sqrt n) instead of a full copy.
+        """
+        step = max(1, math.isqrt(self._size))
+        checkpoints = []
         cur = self.head
-        parts = []
+        pos = 0
         while cur:
-            parts.append(str(cur.data))
+            if pos % step == 0:
+                checkpoints.append(cur)
             cur = cur.next
-        parts.append("None")
-        print(" -> ".join(parts))
+            pos += 1
+        for start in reversed(checkpoints):
+            segment = []
+            cur = start
+            for _ in range(step):
+                if cur is None:
+                    break
+                segment.append(cur.data)
+                cur = cur.next
+            yield from reversed(segment)
+
+    def window(self, start: int, stop: Optional[int] = None, step: int = 1) -> Iterator[Any]:
+        """Lazily yield data[start:stop:step] (itertools.islice semantics)."""
+        return islice(self, start, stop, step)
+
+    def print_list(self, file: Optional[TextIO] = None, chunk_size: int = 1024) -> None:
+        """
+        Nicely print the list contents.
+        Output is written to `file` (default stdout) `chunk_size` nodes at a
+        time, so the full joined string is never built in memory.
+        """
+        out = file if file is not None else sys.stdout
+        it = iter(self)
+        while True:
+            chunk = [str(x) for x in islice(it, chunk_size)]
+            if not chunk:
+                break
+            out.write(" -> ".join(chunk))
+            out.write(" -> ")
+        out.write("None\n")
 
     # ---------- Reverse ----------
     def reverse(self) -> None:
@@ -143,6 +378,7 @@ class LinkedList:
         """
         prev = None
         cur = self.head
+        self.tail = cur
         while cur:
             next_node = cur.next
             cur.next = prev
@@ -152,8 +388,16 @@ class LinkedList:
 
     # ---------- Utilities ----------
     def clear(self) -> None:
-        """Clear the list."""
+        """Clear the list (returns every node to the pool, if one is set)."""
+        if self.pool is not None:
+            cur = self.head
+            while cur:
+                next_node = cur.next
+                self.pool.release(cur)
+                cur = next_node
         self.head = None
+        self.tail = None
+        self._size = 0
 
 
 # -----
@@ -240,10 +484,62 @@ def demo_edge_cases():
     ll.print_list()
 
 
+def demo_bulk_and_sort():
+    print("\n=== LinkedList: bulk build, splice, merge and sort demo ===")
+    ll = LinkedList.from_iterable([5, 3, 9])
+    ll.extend([1, 7])
+    ll.print_list()  # 5 -> 3 -> 9 -> 1 -> 7 -> None
+    ll.splice(LinkedList.from_iterable([100, 200]), 2)
+    ll.print_list()  # 5 -> 3 -> 100 -> 200 -> 9 -> 1 -> 7 -> None
+    ll.sort()
+    ll.print_list()  # 1 -> 3 -> 5 -> 7 -> 9 -> 100 -> 200 -> None
+    merged = LinkedList.merge_sorted(ll, LinkedList.from_iterable([2, 4, 150]))
+    merged.print_list()  # 1 -> 2 -> 3 -> 4 -> 5 -> 7 -> 9 -> 100 -> 150 -> 200 -> None
+    assert merged.to_list() == [1, 2, 3, 4, 5, 7, 9, 100, 150, 200]
+
+
+def measure_churn_peak(pool: Optional[NodePool], batch: int = 10_000, rounds: int = 5) -> int:
+    """
+    Insert `batch` values then delete them again, `rounds` times, and return the
+    tracemalloc peak (bytes) above the starting point. The first round runs
+    before tracing starts so a pool is already warm.
+    """
+    ll = LinkedList(pool=pool)
+    values = [i & 0xFF for i in range(batch)]  # small ints are cached, no allocation
+
+    def churn():
+        for v in values:
+            ll.insert_at_beginning(v)
+        for v in reversed(values):
+            ll.delete_by_value(v)
+
+    churn()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(rounds):
+            churn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def demo_node_pool():
+    print("\n=== LinkedList: NodePool churn demo ===")
+    plain = measure_churn_peak(pool=None)
+    pooled = measure_churn_peak(pool=NodePool())
+    print(f"Peak bytes allocated during churn without pool: {plain}")
+    print(f"Peak bytes allocated during churn with pool:    {pooled}")
+    assert pooled * 10 < plain, "NodePool should avoid per-insert node allocations"
+
+
 def run_all_demos():
     demo_basic_operations()
     # demo_reverse()
     # demo_edge_cases()
+    demo_bulk_and_sort()
+    demo_node_pool()  # tracemalloc check of the NodePool allocation claim
     # print("\nAll demos completed.")
 
 
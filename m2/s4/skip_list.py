@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+skip_list.py
+
+Indexable skip list: a drop-in alternative to linked_lists.LinkedList for
+long sequences with many positional operations.
+
+Every forward link also stores its width (how many positions it skips), so
+positions can be found by descending the levels instead of walking node by
+node:
+ - insert_at_position, get(index), delete_at(index): O(log n) expected
+ - insert_sorted, search_sorted: O(log n) expected, for lists kept in order
+ - LinkedList API (insert_at_beginning, insert_at_end, delete_by_value,
+   search, count_nodes, print_list, reverse, to_list, clear)
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, List, Optional
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    """A skip list node with one forward link and width per level."""
+
+    __slots__ = ("data", "next", "width")
+
+    def __init__(self, data: Any, level: int):
+        self.data: Any = data
+        self.next: List[Optional[SkipNode]] = [None] * level
+        self.width: List[int] = [0] * level
+
+    def __repr__(self):
+        return f"SkipNode({self.data!r})"
+
+
+class IndexableSkipList:
+    """
+    Positional skip list. The head sentinel sits at position -1 and a None link
+    points at the end of the list (position == len), so every width is a plain
+    position difference.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+        self._head = SkipNode(None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._head.width[0] = 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self._rng.getrandbits(1):
+            level += 1
+        return level
+
+    # ---------- Internal navigation ----------
+    def _predecessors_by_index(self, index: int):
+        """Return (update, positions): the last node before `index` on every level."""
+        update = [self._head] * MAX_LEVEL
+        positions = [-1] * MAX_LEVEL
+        node, pos = self._head, -1
+        for lvl in range(self._level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] < index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            update[lvl] = node
+            positions[lvl] = pos
+        return update, positions
+
+    def _predecessors_by_value(self, value: Any):
+        """Like _predecessors_by_index, but stops before the first node >= value."""
+        update = [self._head] * MAX_LEVEL
+        positions = [-1] * MAX_LEVEL
+        node, pos = self._head, -1
+        for lvl in range(self._level - 1, -1, -1):
+            while node.next[lvl] is not None and node.next[lvl].data < value:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            update[lvl] = node
+            positions[lvl] = pos
+        return update, positions
+
+    def _link(self, update, positions, index: int, data: Any) -> None:
+        level = self._random_level()
+        if level > self._level:
+            for lvl in range(self._level, level):
+                # empty level: head links straight to the end (position == size)
+                self._head.width[lvl] = self._size + 1
+            self._level = level
+
+        new_node = SkipNode(data, level)
+        for lvl in range(level):
+            prev = update[lvl]
+            end = positions[lvl] + prev.width[lvl] + 1  # successor position after insert
+            new_node.next[lvl] = prev.next[lvl]
+            new_node.width[lvl] = end - index
+            prev.next[lvl] = new_node
+            prev.width[lvl] = index - positions[lvl]
+        for lvl in range(level, self._level):
+            update[lvl].width[lvl] += 1
+        self._size += 1
+
+    # ---------- Positional API ----------
+    def insert_at_position(self, index: int, data: Any) -> None:
+        """
+        Insert at specified index (0-based), O(log n).
+        If index <= 0 => insert at beginning.
+        If index >= length => insert at end.
+        """
+        index = max(0, min(index, self._size))
+        update, positions = self._predecessors_by_index(index)
+        self._link(update, positions, index, data)
+
+    def insert_at_beginning(self, data: Any) -> None:
+        self.insert_at_position(0, data)
+
+    def insert_at_end(self, data: Any) -> None:
+        self.insert_at_position(self._size, data)
+
+    def get(self, index: int) -> Any:
+        """Return the value at `index` (0-based), O(log n)."""
+        if index < 0 or index >= self._size:
+            raise IndexError("index out of range")
+        node, pos = self._head, -1
+        for lvl in range(self._level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] <= index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+        return node.data
+
+    def delete_at(self, index: int) -> Any:
+        """Remove and return the value at `index` (0-based), O(log n)."""
+        if index < 0 or index >= self._size:
+            raise IndexError("index out of range")
+        update, _ = self._predecessors_by_index(index)
+        target = update[0].next[0]
+        for lvl in range(self._level):
+            prev = update[lvl]
+            if prev.next[lvl] is target:
+                prev.width[lvl] += target.width[lvl] - 1
+                prev.next[lvl] = target.next[lvl]
+            else:
+                prev.width[lvl] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+        return target.data
+
+    # ---------- Sorted API ----------
+    def insert_sorted(self, data: Any) -> int:
+        """Insert keeping ascending order (before equal values); return its index."""
+        update, positions = self._predecessors_by_value(data)
+        index = positions[0] + 1
+        self._link(update, positions, index, data)
+        return index
+
+    def search_sorted(self, value: Any) -> int:
+        """Return the index of `value` in a sorted list, or -1. O(log n)."""
+        update, positions = self._predecessors_by_value(value)
+        candidate = update[0].next[0]
+        if candidate is not None and candidate.data == value:
+            return positions[0] + 1
+        return -1
+
+    # ---------- LinkedList-compatible API ----------
+    def delete_by_value(self, value: Any) -> bool:
+        """Delete first node with given value (O(n) scan to find it)."""
+        node, index = self._head.next[0], 0
+        while node is not None:
+            if node.data == value:
+                self.delete_at(index)
+                return True
+            node = node.next[0]
+            index += 1
+        return False
+
+    def search(self, value: Any) -> bool:
+        """Return True if value exists (O(n); use search_sorted on sorted lists)."""
+        node = self._head.next[0]
+        while node is not None:
+            if node.data == value:
+                return True
+            node = node.next[0]
+        return False
+
+    def count_nodes(self) -> int:
+        return self._size
+
+    def to_list(self) -> list:
+        out = []
+        node = self._head.next[0]
+        while node is not None:
+            out.append(node.data)
+            node = node.next[0]
+        return out
+
+    def print_list(self) -> None:
+        parts = [str(x) for x in self.to_list()]
+        parts.append("None")
+        print(" -> ".join(parts))
+
+    def reverse(self) -> None:
+        """Reverse by rebuilding from the reversed values (O(n log n))."""
+        values = self.to_list()
+        self.clear()
+        for value in reversed(values):
+            self.insert_at_end(value)
+
+    def clear(self) -> None:
+        self._head = SkipNode(None, MAX_LEVEL)
+        self._head.width[0] = 1
+        self._level = 1
+        self._size = 0
+
+
+# -----
+# Demo
+# -----
+
+
+def demo_skip_list():
+    print("=== IndexableSkipList demo ===")
+    sl = IndexableSkipList(seed=1)
+    for v in (10, 20, 30):
+        sl.insert_at_end(v)
+    sl.insert_at_beginning(5)
+    sl.insert_at_position(2, 15)
+    sl.print_list()  # expected: 5 -> 10 -> 15 -> 20 -> 30 -> None
+    print("get(3) =", sl.get(3))  # 20
+    print("delete_at(1) =", sl.delete_at(1))  # 10
+    sl.print_list()  # expected: 5 -> 15 -> 20 -> 30 -> None
+    assert sl.to_list() == [5, 15, 20, 30]
+
+    ordered = IndexableSkipList(seed=2)
+    for v in (42, 7, 19, 3, 88):
+        ordered.insert_sorted(v)
+    ordered.print_list()  # expected: 3 -> 7 -> 19 -> 42 -> 88 -> None
+    print("search_sorted(42) =", ordered.search_sorted(42))  # 3
+    assert ordered.search_sorted(42) == 3 and ordered.search_sorted(5) == -1
+
+
+if __name__ == "__main__":
+    demo_skip_list()
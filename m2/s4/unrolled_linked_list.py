@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+unrolled_linked_list.py
+
+Unrolled linked list: each node (Block) holds up to `block_size` items in a
+small Python list, so traversal, search and positional walks make one
+pointer hop per block instead of one per item, and per-item overhead is one
+list slot instead of one Node object.
+
+Exposes the LinkedList API from linked_lists.py:
+ - insert_at_beginning, insert_at_end
+ - insert_at_position, delete_by_value
+ - search, count_nodes, print_list
+ - reverse (in-place)
+ - to_list, clear
+Includes a benchmark against LinkedList and list for middle inserts.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Iterator, List, Optional
+
+from linked_lists import LinkedList
+
+DEFAULT_BLOCK_SIZE = 64
+
+
+class Block:
+    """A node holding a run of up to block_size items."""
+
+    __slots__ = ("items", "next")
+
+    def __init__(self, items: Optional[List[Any]] = None):
+        self.items: List[Any] = items if items is not None else []
+        self.next: Optional[Block] = None
+
+    def __repr__(self):
+        return f"Block({self.items!r})"
+
+
+class UnrolledLinkedList:
+    """Singly linked list of fixed-capacity blocks."""
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        if block_size < 2:
+            raise ValueError("block_size must be >= 2")
+        self.block_size = block_size
+        self.head: Optional[Block] = None
+        self.tail: Optional[Block] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        block = self.head
+        while block:
+            yield from block.items
+            block = block.next
+
+    # ---------- Block maintenance ----------
+    def _split(self, block: Block) -> None:
+        """Move the upper half of an overfull block into a new following block."""
+        half = len(block.items) // 2
+        new_block = Block(block.items[half:])
+        del block.items[half:]
+        new_block.next = block.next
+        block.next = new_block
+        if block is self.tail:
+            self.tail = new_block
+
+    def _rebalance(self, prev: Optional[Block], block: Block) -> None:
+        """After a delete: drop an empty block, or merge an underfull one into its successor."""
+        if not block.items:
+            if prev is None:
+                self.head = block.next
+            else:
+                prev.next = block.next
+            if block is self.tail:
+                self.tail = prev
+            return
+        nxt = block.next
+        if nxt is not None and len(block.items) + len(nxt.items) <= self.block_size // 2 + 1:
+            block.items.extend(nxt.items)
+            block.next = nxt.next
+            if nxt is self.tail:
+                self.tail = block
+
+    # ---------- Insertion ----------
+    def insert_at_beginning(self, data: Any) -> None:
+        """Insert at the head (O(block_size))."""
+        if self.head is None or len(self.head.items) >= self.block_size:
+            block = Block([data])
+            block.next = self.head
+            self.head = block
+            if self.tail is None:
+                self.tail = block
+        else:
+            self.head.items.insert(0, data)
+        self._size += 1
+
+    def insert_at_end(self, data: Any) -> None:
+        """Insert at the tail (O(1))."""
+        if self.tail is None:
+            self.head = self.tail = Block([data])
+        elif len(self.tail.items) >= self.block_size:
+            block = Block([data])
+            self.tail.next = block
+            self.tail = block
+        else:
+            self.tail.items.append(data)
+        self._size += 1
+
+    def insert_at_position(self, index: int, data: Any) -> None:
+        """
+        Insert at specified index (0-based).
+        If index <= 0 => insert at beginning.
+        If index >= length => insert at end.
+        Walks O(n / block_size) blocks.
+        """
+        if index <= 0 or self.head is None:
+            self.insert_at_beginning(data)
+            return
+        if index >= self._size:
+            self.insert_at_end(data)
+            return
+        block = self.head
+        while index > len(block.items):
+            index -= len(block.items)
+            block = block.next
+        block.items.insert(index, data)
+        self._size += 1
+        if len(block.items) > self.block_size:
+            self._split(block)
+
+    # ---------- Deletion ----------
+    def delete_by_value(self, value: Any) -> bool:
+        """
+        Delete first item with given value.
+        Returns True if deleted, False if not found.
+        """
+        prev = None
+        block = self.head
+        while block:
+            try:
+                i = block.items.index(value)
+            except ValueError:
+                prev = block
+                block = block.next
+                continue
+            del block.items[i]
+            self._size -= 1
+            self._rebalance(prev, block)
+            return True
+        return False
+
+    # ---------- Query ----------
+    def search(self, value: Any) -> bool:
+        """Return True if value exists (one pointer hop per block)."""
+        block = self.head
+        while block:
+            if value in block.items:
+                return True
+            block = block.next
+        return False
+
+    def count_nodes(self) -> int:
+        """Return number of items (O(1))."""
+        return self._size
+
+    def count_blocks(self) -> int:
+        count = 0
+        block = self.head
+        while block:
+            count += 1
+            block = block.next
+        return count
+
+    def to_list(self) -> list:
+        out = []
+        block = self.head
+        while block:
+            out.extend(block.items)
+            block = block.next
+        return out
+
+    # ---------- Traversal / Display ----------
+    def print_list(self) -> None:
+        parts = [str(x) for x in self]
+        parts.append("None")
+        print(" -> ".join(parts))
+
+    # ---------- Reverse ----------
+    def reverse(self) -> None:
+        """Reverse the block chain in-place and reverse each block's items."""
+        prev = None
+        block = self.head
+        self.tail = block
+        while block:
+            block.items.reverse()
+            next_block = block.next
+            block.next = prev
+            prev = block
+            block = next_block
+        self.head = prev
+
+    # ---------- Utilities ----------
+    def clear(self) -> None:
+        self.head = None
+        self.tail = None
+        self._size = 0
+
+
+# -----
+# Benchmarks
+# -----
+
+
+def benchmark_middle_inserts(n: int = 10_000, seed: int = 0) -> dict:
+    """
+    Build a container of `n` items by inserting each at a random position,
+    then time a full search for a missing value. Compares UnrolledLinkedList,
+    LinkedList and Python list.
+    """
+    rng = random.Random(seed)
+    positions = [rng.randrange(i + 1) for i in range(n)]
+
+    def build_linked(container):
+        for i, pos in enumerate(positions):
+            container.insert_at_position(pos, i)
+        return container
+
+    def build_list():
+        lst = []
+        for i, pos in enumerate(positions):
+            lst.insert(pos, i)
+        return lst
+
+    results = {}
+    for name, build, search in (
+        ("UnrolledLinkedList", lambda: build_linked(UnrolledLinkedList()), lambda c: c.search(-1)),
+        ("LinkedList", lambda: build_linked(LinkedList()), lambda c: c.search(-1)),
+        ("list", build_list, lambda c: -1 in c),
+    ):
+        start = time.perf_counter()
+        container = build()
+        t_insert = time.perf_counter() - start
+        start = time.perf_counter()
+        search(container)
+        t_search = time.perf_counter() - start
+        results[name] = {"insert_middle": t_insert, "search_miss": t_search}
+        print(f"{name:>18}: insert_middle={t_insert:.4f}s | search_miss={t_search:.6f}s")
+    return results
+
+
+def demo_unrolled():
+    print("=== UnrolledLinkedList demo (block_size=4) ===")
+    ul = UnrolledLinkedList(block_size=4)
+    for v in range(10):
+        ul.insert_at_end(v)
+    ul.insert_at_position(5, 99)
+    ul.delete_by_value(2)
+    ul.print_list()  # 0 -> 1 -> 3 -> 4 -> 99 -> 5 -> 6 -> 7 -> 8 -> 9 -> None
+    print("Blocks:", ul.count_blocks(), "items:", ul.count_nodes())
+    ul.reverse()
+    assert ul.to_list() == [9, 8, 7, 6, 5, 99, 4, 3, 1, 0]
+
+
+if __name__ == "__main__":
+    demo_unrolled()
+    print("\n=== Random middle inserts, n=10000 ===")
+    benchmark_middle_inserts()
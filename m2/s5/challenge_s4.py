@@ -1,7 +1,17 @@
-from typing import Any, Optional
+import math
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Iterator, Optional, TextIO
+
+# __repr__ shows at most this many nodes; use print_list to stream everything
+REPR_LIMIT = 1000
 
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any):
         self.data: Any = data
         self.next: Optional[Node] = None
@@ -19,14 +29,53 @@ class LinkedList:
         new_node.next = self.head
         self.head = new_node
 
-    def __repr__(self):
-        nodes = []
+    def _nodes(self) -> Iterator[Node]:
         current = self.head
         while current:
-            nodes.append(repr(current))
+            yield current
             current = current.next
+
+    def __iter__(self) -> Iterator[Any]:
+        for node in self._nodes():
+            yield node.data
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Tail-to-head data using O(sqrt n) checkpoints instead of a full copy."""
+        step = max(1, math.isqrt(self.count_nodes()))
+        checkpoints = [node for i, node in enumerate(self._nodes()) if i % step == 0]
+        for start in reversed(checkpoints):
+            segment = []
+            current = start
+            while current and len(segment) < step:
+                segment.append(current.data)
+                current = current.next
+            yield from reversed(segment)
+
+    def window(self, start: int, stop: Optional[int] = None, step: int = 1) -> Iterator[Any]:
+        """Lazily yield data[start:stop:step] (itertools.islice semantics)."""
+        return islice(self, start, stop, step)
+
+    def __repr__(self):
+        nodes = [repr(node) for node in islice(self._nodes(), REPR_LIMIT + 1)]
+        if len(nodes) > REPR_LIMIT:
+            nodes[-1] = "..."
         return " -> ".join(nodes)
 
+    def print_list(self, file: Optional[TextIO] = None, chunk_size: int = 1024) -> None:
+        """Write the full repr-style listing to `file` in chunks of `chunk_size` nodes."""
+        out = file if file is not None else sys.stdout
+        nodes = self._nodes()
+        first = True
+        while True:
+            chunk = [repr(node) for node in islice(nodes, chunk_size)]
+            if not chunk:
+                break
+            if not first:
+                out.write(" -> ")
+            out.write(" -> ".join(chunk))
+            first = False
+        out.write("\n")
+
     def count_nodes(self) -> int:
         """Return number of nodes."""
         count = 0
@@ -75,29 +124,210 @@ class LinkedList:
 
 
 class DNode:
+    __slots__ = ("data", "prev", "next", "owner")
+
     def __init__(self, data: Any):
         self.data = data
-        self.prev = None
-        self.next = None
+        self.prev: Optional[DNode] = None
+        self.next: Optional[DNode] = None
+        self.owner: Optional[DoublyLinkedList] = None  # list the node is linked into, if any
+
+    def __repr__(self):
+        return f"DNode({self.data!r})"
+
+
+class DoublyLinkedList:
+    """
+    Doubly linked list built on DNode.
+
+    append/appendleft return the new node so callers can keep it as a handle;
+    remove, move_to_front and move_to_end then splice that node in O(1)
+    without scanning the list. Handles must belong to this list: a node that
+    was already removed, or that belongs to another list, raises ValueError.
+    """
+
+    def __init__(self):
+        self.head: Optional[DNode] = None
+        self.tail: Optional[DNode] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _nodes(self) -> Iterator[DNode]:
+        current = self.head
+        while current:
+            yield current
+            current = current.next
+
+    def __iter__(self) -> Iterator[Any]:
+        for node in self._nodes():
+            yield node.data
+
+    def __reversed__(self) -> Iterator[Any]:
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+
+    def __repr__(self):
+        nodes = [repr(node) for node in islice(self._nodes(), REPR_LIMIT + 1)]
+        if len(nodes) > REPR_LIMIT:
+            nodes[-1] = "..."
+        return " <-> ".join(nodes)
+
+    # ---------- Linking helpers ----------
+    def _check_owner(self, node: DNode) -> None:
+        if node.owner is not self:
+            state = "is not linked into any list" if node.owner is None else "belongs to another list"
+            raise ValueError(f"{node!r} {state}")
+
+    def _link_front(self, node: DNode) -> None:
+        node.owner = self
+        node.prev = None
+        node.next = self.head
+        if self.head:
+            self.head.prev = node
+        else:
+            self.tail = node
+        self.head = node
+        self._size += 1
+
+    def _link_back(self, node: DNode) -> None:
+        node.owner = self
+        node.next = None
+        node.prev = self.tail
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self._size += 1
+
+    def _unlink(self, node: DNode) -> None:
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        node.owner = None
+        self._size -= 1
+
+    # ---------- Public API (all O(1)) ----------
+    def append(self, data: Any) -> DNode:
+        node = DNode(data)
+        self._link_back(node)
+        return node
+
+    def appendleft(self, data: Any) -> DNode:
+        node = DNode(data)
+        self._link_front(node)
+        return node
+
+    def pop(self) -> Any:
+        if not self.tail:
+            raise IndexError("pop from empty DoublyLinkedList")
+        node = self.tail
+        self._unlink(node)
+        return node.data
+
+    def popleft(self) -> Any:
+        if not self.head:
+            raise IndexError("pop from empty DoublyLinkedList")
+        node = self.head
+        self._unlink(node)
+        return node.data
+
+    def remove(self, node: DNode) -> Any:
+        """Unlink the given node handle and return its data."""
+        self._check_owner(node)
+        self._unlink(node)
+        return node.data
+
+    def move_to_front(self, node: DNode) -> None:
+        self._check_owner(node)
+        if node is self.head:
+            return
+        self._unlink(node)
+        self._link_front(node)
+
+    def move_to_end(self, node: DNode) -> None:
+        self._check_owner(node)
+        if node is self.tail:
+            return
+        self._unlink(node)
+        self._link_back(node)
+
+    def to_list(self) -> list:
+        return list(self)
+
+
+def benchmark_against_deque(n: int = 100_000) -> dict:
+    """Time n appends, appendlefts, pops and poplefts on DoublyLinkedList vs deque."""
+    results = {}
+    for name, factory in (("DoublyLinkedList", DoublyLinkedList), ("deque", deque)):
+        timings = {}
+        for op in ("append", "appendleft", "pop", "popleft"):
+            container = factory()
+            if op in ("pop", "popleft"):
+                for i in range(n):
+                    container.append(i)
+            method = getattr(container, op)
+            start = time.perf_counter()
+            if op in ("append", "appendleft"):
+                for i in range(n):
+                    method(i)
+            else:
+                for _ in range(n):
+                    method()
+            timings[op] = time.perf_counter() - start
+        results[name] = timings
+
+    print(f"n={n}")
+    for op in ("append", "appendleft", "pop", "popleft"):
+        dll_t = results["DoublyLinkedList"][op]
+        dq_t = results["deque"][op]
+        print(f"{op:>10}: DoublyLinkedList={dll_t:.6f}s | deque={dq_t:.6f}s | ratio={dll_t / dq_t:.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    linked_list = LinkedList()
+    linked_list.insert_at_beginning(10)
+    linked_list.insert_at_beginning(20)
+    linked_list.insert_at_beginning(30)
 
 
-linked_list = LinkedList()
-linked_list.insert_at_beginning(10)
-linked_list.insert_at_beginning(20)
-linked_list.insert_at_beginning(30)
+    print(linked_list)
 
 
-print(linked_list)
+    linked_list.reverse()
+    print("Reversed List:")
+    print(linked_list)
 
 
-linked_list.reverse()
-print("Reversed List:")
-print(linked_list)
+    linked_list.insert_at_position(1, 25)
+    print("\nAfter Inserting 25 at Position 1:")
+    print(linked_list)
 
 
-linked_list.insert_at_position(1, 25)
-print("\nAfter Inserting 25 at Position 1:")
-print(linked_list)
+    print("\nNode count:", linked_list.count_nodes())
 
+    dll = DoublyLinkedList()
+    handles = [dll.append(v) for v in (1, 2, 3, 4)]
+    dll.move_to_front(handles[2])
+    dll.remove(handles[1])
+    print("\nDoublyLinkedList after move_to_front(3) and remove(2):")
+    print(dll)
+    try:
+        dll.remove(handles[1])  # stale handle: already removed
+    except ValueError as e:
+        print("Stale handle refused:", e)
+    assert dll.to_list() == [3, 1, 4] and len(dll) == 3
 
-print("\nNode count:", linked_list.count_nodes())
+    print()
+    benchmark_against_deque()